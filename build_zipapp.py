@@ -0,0 +1,60 @@
+#!/usr/bin/env python3
+"""Build a single-file dd-cli zipapp with precompiled bytecode.
+
+Usage:
+    python build_zipapp.py [-o dd-cli.pyz] [-p '/usr/bin/env python3']
+
+The archive contains only the dd_cli package; requests (and optionally
+orjson) must be installed for the interpreter that runs it. Bytecode is
+compiled for the building interpreter, so build with the same Python
+version that will run the archive.
+"""
+
+import argparse
+import compileall
+import shutil
+import sys
+import tempfile
+import zipapp
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parent
+
+MAIN = '''from dd_cli.cli import main
+
+main()
+'''
+
+
+def build(output: Path, interpreter: str):
+    with tempfile.TemporaryDirectory() as tmp:
+        staging = Path(tmp)
+        shutil.copytree(
+            ROOT / "dd_cli",
+            staging / "dd_cli",
+            ignore=shutil.ignore_patterns("__pycache__", "*.pyc", "*.bak"),
+        )
+        (staging / "__main__.py").write_text(MAIN, encoding="utf-8")
+
+        # zipimport only loads bytecode stored next to the source
+        # (legacy layout), not from __pycache__/
+        if not compileall.compile_dir(staging, quiet=1, legacy=True):
+            raise SystemExit("compileall failed")
+
+        zipapp.create_archive(staging, target=output, interpreter=interpreter)
+
+    print(f"Wrote {output}", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build dd-cli as a zipapp")
+    parser.add_argument("-o", "--output", type=Path, default=ROOT / "dd-cli.pyz",
+                        help="Output archive (default: dd-cli.pyz)")
+    parser.add_argument("-p", "--python", default="/usr/bin/env python3",
+                        help="Shebang interpreter (default: /usr/bin/env python3)")
+    args = parser.parse_args()
+    build(args.output, args.python)
+
+
+if __name__ == "__main__":
+    main()
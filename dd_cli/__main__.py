@@ -0,0 +1,5 @@
+"""Allow running the CLI as ``python -m dd_cli``."""
+
+from .cli import main
+
+main()
@@ -1,11 +1,21 @@
 """Authentication handling for Datadog web session."""
 
+import functools
 import os
+import re
 import sys
 from dataclasses import dataclass
 from pathlib import Path
-from typing import Optional
-from datetime import datetime
+from typing import Optional, Tuple
+from datetime import datetime, timezone
+
+
+# KEY="value" lines and the "# Created: <iso>" header written by save_auth()
+# (values are captured to end of line and unquoted in _parse_auth)
+_KV_RE = re.compile(
+    r"^[ \t]*(DOGWEB_COOKIE|CSRF_TOKEN|DD_BASE_URL)[ \t]*=([^\r\n]*)", re.M
+)
+_CREATED_RE = re.compile(r"^[ \t]*#[^\r\n]*?Created:([^\r\n]*)", re.M)
 
 
 @dataclass
@@ -17,54 +27,69 @@ class Auth:
     created_at: Optional[datetime] = None
 
 
+@functools.cache
 def get_auth_file_path() -> Path:
     """Get the path to the auth file."""
     return Path.home() / ".datadog-auth"
 
 
+def _read_auth_file(auth_file: Path) -> Optional[Tuple[str, int]]:
+    """Read the auth file, returning its text and mtime (ns) from one open + fstat."""
+    try:
+        fd = os.open(auth_file, os.O_RDONLY)
+    except FileNotFoundError:
+        return None
+    try:
+        st = os.fstat(fd)
+        data = os.read(fd, st.st_size)
+    finally:
+        os.close(fd)
+    return data.decode(), st.st_mtime_ns
+
+
 def load_auth() -> Optional[Auth]:
     """Load authentication from ~/.datadog-auth file."""
-    auth_file = get_auth_file_path()
-    
-    if not auth_file.exists():
-        return None
-    
-    dogweb_cookie = None
-    csrf_token = None
-    base_url = "https://app.datadoghq.eu"
-    created_at = None
+    return load_auth_with_mtime()[0]
+
+
+def load_auth_with_mtime() -> Tuple[Optional[Auth], Optional[int]]:
+    """Load authentication plus the auth file's mtime (ns) for cache validation."""
+    read = _read_auth_file(get_auth_file_path())
+    if read is None:
+        return None, None
     
-    with open(auth_file, "r") as f:
-        for line in f:
-            line = line.strip()
-            if line.startswith("#"):
-                # Parse created timestamp from comment
-                if "Created:" in line:
-                    try:
-                        date_str = line.split("Created:")[1].strip()
-                        created_at = datetime.fromisoformat(date_str)
-                    except (ValueError, IndexError):
-                        pass
-                continue
-            if "=" in line:
-                key, _, value = line.partition("=")
-                key = key.strip()
-                value = value.strip().strip('"').strip("'")
-                
-                if key == "DOGWEB_COOKIE":
-                    dogweb_cookie = value
-                elif key == "CSRF_TOKEN":
-                    csrf_token = value
-                elif key == "DD_BASE_URL":
-                    base_url = value
+    text, mtime_ns = read
+    return _parse_auth(text), mtime_ns
+
+
+def _parse_auth(text: str) -> Optional[Auth]:
+    """Parse the contents of an auth file."""
+    values = {
+        key: value.strip().strip('"').strip("'")
+        for key, value in _KV_RE.findall(text)
+    }
     
+    dogweb_cookie = values.get("DOGWEB_COOKIE")
+    csrf_token = values.get("CSRF_TOKEN")
     if not dogweb_cookie or not csrf_token:
         return None
     
+    # Parse created timestamp from comment; the last valid one wins
+    created_at = None
+    for match in _CREATED_RE.finditer(text):
+        date_str = match.group(1).split("Created:")[0].strip()
+        try:
+            created_at = datetime.fromisoformat(date_str)
+        except ValueError:
+            pass
+    # Files written before timestamps carried an offset are local time
+    if created_at is not None and created_at.tzinfo is None:
+        created_at = created_at.astimezone()
+    
     return Auth(
         dogweb_cookie=dogweb_cookie,
         csrf_token=csrf_token,
-        base_url=base_url,
+        base_url=values.get("DD_BASE_URL", "https://app.datadoghq.eu"),
         created_at=created_at,
     )
 
@@ -75,7 +100,7 @@ def save_auth(auth: Auth) -> None:
     
     with open(auth_file, "w") as f:
         f.write("# Datadog auth tokens - regenerate when expired\n")
-        f.write(f'# Created: {datetime.now().isoformat()}\n')
+        f.write(f'# Created: {datetime.now(timezone.utc).isoformat()}\n')
         f.write(f'DOGWEB_COOKIE="{auth.dogweb_cookie}"\n')
         f.write(f'CSRF_TOKEN="{auth.csrf_token}"\n')
         if auth.base_url != "https://app.datadoghq.eu":
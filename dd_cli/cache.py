@@ -0,0 +1,72 @@
+"""Short-lived on-disk cache for paginated list responses.
+
+Lets a command re-run within the TTL (e.g. tweaking a jq filter over
+`dd-cli fetch-all`) reuse pages instead of re-requesting them. Entries
+are files named by a hash of the request, written owner-only since they
+hold log content.
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .jsonlib import encode_default
+
+
+def default_cache_dir() -> Path:
+    """Cache directory (``$XDG_CACHE_HOME/dd-cli/pages`` or ``~/.cache/dd-cli/pages``)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "dd-cli" / "pages"
+
+
+class PageCache:
+    """File-per-entry cache with a fixed TTL."""
+
+    def __init__(self, directory: Optional[Path] = None, ttl: float = 60.0):
+        self.directory = directory or default_cache_dir()
+        self.ttl = ttl
+        self._pruned = False
+
+    @staticmethod
+    def key(parts: Dict[str, Any]) -> str:
+        """Stable key for a JSON-serializable description of a request."""
+        blob = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=encode_default)
+        return hashlib.sha1(blob.encode()).hexdigest()
+
+    def get(self, key: str) -> Optional[Any]:
+        """Return the cached value, or None if missing or expired."""
+        path = self.directory / key
+        try:
+            if time.time() - path.stat().st_mtime > self.ttl:
+                return None
+            return json.loads(path.read_bytes())
+        except (OSError, ValueError):
+            return None
+
+    def set(self, key: str, value: Any):
+        """Store a value; failures are ignored (the cache is best-effort)."""
+        try:
+            self.directory.mkdir(mode=0o700, parents=True, exist_ok=True)
+            if not self._pruned:
+                self._prune()
+            fd, tmp = tempfile.mkstemp(dir=self.directory, prefix=".tmp-")
+            with os.fdopen(fd, "wb") as f:
+                f.write(json.dumps(value, separators=(",", ":")).encode())
+            os.replace(tmp, self.directory / key)
+        except OSError:
+            pass
+
+    def _prune(self):
+        """Delete expired entries (once per instance)."""
+        self._pruned = True
+        cutoff = time.time() - self.ttl
+        for path in self.directory.iterdir():
+            try:
+                if path.stat().st_mtime < cutoff:
+                    path.unlink()
+            except OSError:
+                pass
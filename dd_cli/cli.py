@@ -24,499 +24,462 @@ Usage:
 """
 
 import argparse
-import json
+import functools
+import importlib
+import os
+import shutil
 import sys
-from datetime import datetime, timedelta
+from typing import Optional
 
-from .auth import load_auth, interactive_auth_setup, get_auth_file_path
-from .client import DatadogWebLogs, DataSource, RumEventType
-from .profiles import list_profiles
 
+# =============================================================================
+# CLI Parser
+# =============================================================================
 
-def require_auth() -> DatadogWebLogs:
-    """Load auth and create client, or exit with error."""
-    auth = load_auth()
-    if not auth:
-        print("No auth found. Run: dd-cli auth", file=sys.stderr)
-        sys.exit(1)
-    return DatadogWebLogs(auth)
-
+def field_list(value: str) -> list:
+    """Parse a comma-separated list of field paths."""
+    fields = [f.strip() for f in value.split(",") if f.strip()]
+    if not fields:
+        raise argparse.ArgumentTypeError("expected at least one field")
+    return fields
 
-def emit_json(obj, compact: bool = True):
-    """Emit JSON to stdout."""
-    if compact:
-        print(json.dumps(obj, separators=(",", ":")))
-    else:
-        print(json.dumps(obj, indent=2))
 
+@functools.lru_cache(maxsize=1)
+def _cached_profiles() -> tuple:
+    # Imported here: only --profile validation and help need the profiles
+    from .profiles import list_profiles
+    
+    return list_profiles()
 
-# =============================================================================
-# Command Handlers
-# =============================================================================
 
-def cmd_auth(args):
-    """Interactive auth setup."""
-    interactive_auth_setup()
+_DEFAULT_PROFILE = "list"
 
 
-def cmd_status(args):
-    """Check auth status and test connection."""
-    auth = load_auth()
+class _ProfileChoice:
+    """argparse type for --profile that resolves profile names on demand.
     
-    if not auth:
-        print("✗ No auth file found", file=sys.stderr)
-        print(f"  Run: dd-cli auth", file=sys.stderr)
-        sys.exit(1)
+    Used instead of choices=list_profiles() so the profile list is only
+    looked up when a value is validated or help is rendered (via %(type)s).
+    """
     
-    print(f"Auth file: {get_auth_file_path()}", file=sys.stderr)
-    print(f"Cookie length: {len(auth.dogweb_cookie)} chars", file=sys.stderr)
-    print(f"CSRF token: {auth.csrf_token[:20]}...", file=sys.stderr)
+    def __call__(self, value: str) -> str:
+        # argparse also runs the default through type=; it is always valid
+        if value == _DEFAULT_PROFILE:
+            return value
+        if value not in _cached_profiles():
+            raise argparse.ArgumentTypeError(
+                f"invalid choice: {value!r} (choose from {self})"
+            )
+        return value
     
-    if auth.created_at:
-        # Handle both naive and aware datetimes
-        now = datetime.now()
-        created = auth.created_at
-        if created.tzinfo is not None:
-            created = created.replace(tzinfo=None)
-        age = now - created
-        print(f"Token age: {age.days}d {age.seconds // 3600}h", file=sys.stderr)
-    
-    print("\nTesting connection...", file=sys.stderr)
-    client = DatadogWebLogs(auth)
-    
-    if client.test_connection():
-        print("✓ Connection successful", file=sys.stderr)
-    else:
-        print("✗ Connection failed - tokens may be expired", file=sys.stderr)
-        print("  Run: dd-cli auth", file=sys.stderr)
-        sys.exit(1)
-
-
-def cmd_list(args):
-    """List logs matching query."""
-    client = require_auth()
-    result = client.list_logs(
-        query=args.query,
-        hours=args.hours,
-        limit=args.limit,
-        profile=args.profile,
-    )
-    emit_json(result, compact=not args.pretty)
+    def __str__(self) -> str:
+        return ", ".join(_cached_profiles())
 
 
-def cmd_fetch_one(args):
-    """Fetch full details of a single log."""
-    client = require_auth()
-    result = client.fetch_one(args.log_id)
-    emit_json(result, compact=not args.pretty)
+_profile_choice = _ProfileChoice()
 
 
-def cmd_fetch_all(args):
-    """Stream all logs matching query (NDJSON)."""
-    client = require_auth()
+class _LazySubParsersAction(argparse._SubParsersAction):
+    """Subparsers action that fills in a subcommand's arguments on first use.
+    
+    Only the name and help of each subcommand are registered up front; the
+    builder that adds its arguments runs when that subcommand is selected.
+    """
     
-    count = 0
-    for event in client.fetch_all(
-        query=args.query,
-        hours=args.hours,
-        max_logs=args.max,
-        profile=args.profile,
-    ):
-        emit_json(event)
-        count += 1
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._builders = {}
     
-    print(f"Fetched {count} logs", file=sys.stderr)
+    def add_lazy_parser(self, name, builder, **kwargs):
+        parser = self.add_parser(name, **kwargs)
+        self._builders[name] = (builder, parser)
+        return parser
+    
+    def __call__(self, parser, namespace, values, option_string=None):
+        pending = self._builders.pop(values[0], None)
+        if pending:
+            builder, subparser = pending
+            builder(subparser)
+        super().__call__(parser, namespace, values, option_string)
+
+
+# Rendered --help text per (prog, terminal width). The command surface is
+# fixed, so this only matters for long-lived processes (dd-cli --daemon).
+_HELP_CACHE = {}
 
 
-def cmd_deep(args):
-    """Fetch logs with full hydration (list + fetch_one)."""
-    client = require_auth()
+class LazyArgumentParser(argparse.ArgumentParser):
+    """ArgumentParser whose subcommands are built only when selected."""
     
-    count = 0
-    for enriched in client.deep_fetch(
-        query=args.query,
-        hours=args.hours,
-        max_logs=args.max,
-        concurrency=args.concurrency,
-        profile=args.profile,
-    ):
-        emit_json(enriched)
-        count += 1
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.register("action", "parsers", _LazySubParsersAction)
     
-    print(f"Deep-fetched {count} logs", file=sys.stderr)
+    def format_help(self) -> str:
+        key = (self.prog, shutil.get_terminal_size().columns)
+        text = _HELP_CACHE.get(key)
+        if text is None:
+            text = _HELP_CACHE[key] = super().format_help()
+        return text
 
 
-def cmd_top(args):
-    """Aggregate top values for a field."""
-    client = require_auth()
-    result = client.aggregate(
-        query=args.query,
-        hours=args.hours,
-        field=args.field,
-        limit=args.limit,
-    )
-    emit_json(result, compact=not args.pretty)
+# Help strings and choices shared by several subcommands.
+_HELP_QUERY = "Search query"
+_HELP_PRETTY = "Pretty print JSON"
+_HELP_PROFILE = "Column profile: %(type)s (default: %(default)s)"
+_SOURCE_CHOICES = ("logs", "rum")
+_HELP_SOURCE = "Data source (default: logs)"
+_RUM_TYPE_CHOICES = ("session", "view", "action", "resource", "error")
+_HELP_NO_CACHE = "Always re-request pages instead of reusing ones fetched in the last minute"
 
+# --hours defaults. argparse only runs type= on string defaults, so these
+# are floats to match what a user-supplied --hours parses to.
+_F1, _F24, _F48 = 1.0, 24.0, 48.0
 
-def cmd_facet_info(args):
-    """Get facet metadata/stats."""
-    client = require_auth()
-    result = client.facet_info(
-        query=args.query,
-        hours=args.hours,
-        facet=args.facet,
-        limit=args.limit,
-    )
-    emit_json(result, compact=not args.pretty)
 
+# Long descriptions for the command groups, shown in their --help.
+_DESCRIPTIONS = {
+    "rum": """Query Datadog Real User Monitoring (RUM) data.
 
-def cmd_trace(args):
-    """Find all logs for a trace_id."""
-    client = require_auth()
-    result = client.trace_logs(
-        trace_id=args.trace_id,
-        hours=args.hours,
-        limit=args.limit,
-    )
-    emit_json(result, compact=not args.pretty)
+RUM captures frontend user interactions: sessions, page views, clicks, 
+network requests, and JavaScript errors.
 
+Examples:
+  dd-cli rum sessions 'C-13947' --hours 48
+  dd-cli rum actions '"retrieve rates"' --hours 24
+  dd-cli rum errors '@usr.id:alice@example.com' --limit 50
 
-# =============================================================================
-# RUM Command Handlers
-# =============================================================================
+See also: dd-cli list (backend logs), dd-cli fields (explore schema)""",
 
-def cmd_rum_sessions(args):
-    """Query RUM sessions."""
-    client = require_auth()
-    result = client.rum_sessions(args.query, args.hours, args.limit)
-    emit_json(result, compact=not args.pretty)
+    "watchdog": """Search Watchdog insights for anomaly detection.
 
+Watchdog uses AI to detect anomalies in your logs and RUM data.
 
-def cmd_rum_actions(args):
-    """Query RUM actions."""
-    client = require_auth()
-    result = client.rum_actions(args.query, args.hours, args.limit)
-    emit_json(result, compact=not args.pretty)
+Examples:
+  dd-cli watchdog 'status:error' --hours 24
+  dd-cli watchdog 'service:pricing' --source logs""",
 
+    "views": """List saved views in Datadog.
 
-def cmd_rum_views(args):
-    """Query RUM page views."""
-    client = require_auth()
-    result = client.rum_views(args.query, args.hours, args.limit)
-    emit_json(result, compact=not args.pretty)
+Saved views are pre-configured search queries shared by your team.
 
+Examples:
+  dd-cli views list --source logs
+  dd-cli views list --search 'pricing' --source rum""",
 
-def cmd_rum_errors(args):
-    """Query RUM frontend errors."""
-    client = require_auth()
-    result = client.rum_errors(args.query, args.hours, args.limit)
-    emit_json(result, compact=not args.pretty)
+    "topology": """Get service topology/dependency graph from APM.
 
+Shows nodes (services) with health status and edges (dependencies).
 
-def cmd_rum_resources(args):
-    """Query RUM network resources."""
-    client = require_auth()
-    result = client.rum_resources(args.query, args.hours, args.limit)
-    emit_json(result, compact=not args.pretty)
+Examples:
+  dd-cli topology --env sandbox --hours 1 --pretty
+  dd-cli topology --env sandbox --service pricing --pretty""",
+}
 
 
-def cmd_rum_fetch_all(args):
-    """Stream all RUM events."""
-    client = require_auth()
-    event_type = RumEventType(args.type) if args.type else None
-    
-    count = 0
-    for event in client.rum_fetch_all(args.query, args.hours, args.max, event_type=event_type):
-        emit_json(event)
-        count += 1
-    
-    print(f"Fetched {count} RUM events", file=sys.stderr)
+def _describe(p, name):
+    """Attach a command group's long description to its parser."""
+    p.description = _DESCRIPTIONS[name]
+    p.formatter_class = argparse.RawDescriptionHelpFormatter
 
 
-def cmd_rum_top(args):
-    """Aggregate RUM events by field."""
-    client = require_auth()
-    result = client.rum_aggregate(args.query, args.hours, args.field, args.limit)
-    emit_json(result, compact=not args.pretty)
+def _add_common_query_args(p, default_hours, query_help=_HELP_QUERY):
+    """Add the positional query and --hours arguments shared by search commands."""
+    p.add_argument("query", help=query_help)
+    p.add_argument("--hours", type=float, default=default_hours,
+                   help=f"Hours back (default: {default_hours:g})")
 
 
+def _build_auth(p):
+    p.set_defaults(func_module="dd_cli.commands.auth", func_name="cmd_auth")
 
-# =============================================================================
-# Watchdog & Views Command Handlers
-# =============================================================================
 
-def cmd_watchdog(args):
-    """Search Watchdog insights."""
-    client = require_auth()
-    result = client.watchdog_insights(args.query, args.hours, DataSource(args.source))
-    emit_json(result, compact=not args.pretty)
+def _build_status(p):
+    p.set_defaults(func_module="dd_cli.commands.auth", func_name="cmd_status")
 
 
-def cmd_views_list(args):
-    """List saved views."""
-    client = require_auth()
-    result = client.list_views(args.search or "", DataSource(args.source), args.limit)
-    emit_json(result, compact=not args.pretty)
+def _build_list(p):
+    _add_common_query_args(p, _F1)
+    p.add_argument("--limit", type=int, default=100, help="Max logs (default: 100)")
+    p.add_argument("--profile", default=_DEFAULT_PROFILE, type=_profile_choice, metavar="PROFILE",
+                   help=_HELP_PROFILE)
+    p.add_argument("--fields", type=field_list,
+                   help="Comma-separated columns to request (overrides --profile)")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.logs", func_name="cmd_list")
 
 
-# =============================================================================
-# Service Topology Command Handlers
-# =============================================================================
+def _build_fetch_one(p):
+    p.add_argument("log_id", help="Log ID")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.logs", func_name="cmd_fetch_one")
 
-def cmd_topology(args):
-    """Get service topology/dependency graph."""
-    client = require_auth()
-    result = client.get_service_topology(
-        env=args.env,
-        hours=args.hours,
-        service_filter=args.service,
-    )
-    emit_json(result, compact=not args.pretty)
 
+def _build_fetch_all(p):
+    _add_common_query_args(p, _F24)
+    p.add_argument("--max", type=int, default=1000, help="Max logs (default: 1000)")
+    p.add_argument("--profile", default=_DEFAULT_PROFILE, type=_profile_choice, metavar="PROFILE",
+                   help=_HELP_PROFILE)
+    p.add_argument("--no-cache", action="store_true", help=_HELP_NO_CACHE)
+    p.set_defaults(func_module="dd_cli.commands.logs", func_name="cmd_fetch_all")
 
-# =============================================================================
-# CLI Parser
-# =============================================================================
 
-def create_parser() -> argparse.ArgumentParser:
-    parser = argparse.ArgumentParser(
+def _build_deep(p):
+    _add_common_query_args(p, _F24)
+    p.add_argument("--max", type=int, default=50, help="Max logs (default: 50)")
+    p.add_argument("--concurrency", type=int, default=4, help="Parallel workers (default: 4)")
+    p.add_argument("--profile", default=_DEFAULT_PROFILE, type=_profile_choice, metavar="PROFILE",
+                   help=_HELP_PROFILE)
+    p.add_argument("--no-cache", action="store_true", help=_HELP_NO_CACHE)
+    p.set_defaults(func_module="dd_cli.commands.logs", func_name="cmd_deep")
+
+
+def _build_top(p):
+    _add_common_query_args(p, _F1)
+    p.add_argument("--field", default="service", help="Field to aggregate (default: service)")
+    p.add_argument("--limit", type=int, default=10, help="Top N (default: 10)")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.logs", func_name="cmd_top")
+
+
+def _build_facet_info(p):
+    _add_common_query_args(p, _F1)
+    p.add_argument("--facet", default="service", help="Facet path (default: service)")
+    p.add_argument("--limit", type=int, default=50, help="Max values (default: 50)")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.logs", func_name="cmd_facet_info")
+
+
+def _build_trace(p):
+    p.add_argument("trace_id", help="Trace ID")
+    p.add_argument("--hours", type=float, default=_F24, help="Hours back (default: 24)")
+    p.add_argument("--limit", type=int, default=200, help="Max logs (default: 200)")
+    p.add_argument("--fields", type=field_list,
+                   help="Comma-separated columns to request (default: trace profile)")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.logs", func_name="cmd_trace")
+
+
+# =========================================================================
+# RUM Subcommand Group
+# =========================================================================
+
+# Plain RUM search subcommands: name -> (help, default hours, handler, query help).
+RUM_LEAF_CMDS = {
+    "sessions": ("Query user sessions", _F48, "cmd_rum_sessions",
+                 "Search query (e.g., customer ID, user email)"),
+    "actions": ("Query user actions (clicks, inputs)", _F24, "cmd_rum_actions", _HELP_QUERY),
+    "views": ("Query page views", _F24, "cmd_rum_views", _HELP_QUERY),
+    "errors": ("Query frontend JS errors", _F24, "cmd_rum_errors", _HELP_QUERY),
+    "resources": ("Query network resources (XHR, fetch)", _F24, "cmd_rum_resources", _HELP_QUERY),
+}
+
+
+def _build_rum_leaf(p, default_hours, func_name, query_help):
+    _add_common_query_args(p, default_hours, query_help)
+    p.add_argument("--limit", type=int, default=100, help="Max results (default: 100)")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.rum", func_name=func_name)
+
+
+def _build_rum_fetch_all(p):
+    _add_common_query_args(p, _F24)
+    p.add_argument("--max", type=int, default=500, help="Max events (default: 500)")
+    p.add_argument("--type", choices=_RUM_TYPE_CHOICES,
+                   help="Filter by event type")
+    p.add_argument("--no-cache", action="store_true", help=_HELP_NO_CACHE)
+    p.set_defaults(func_module="dd_cli.commands.rum", func_name="cmd_rum_fetch_all")
+
+
+def _build_rum_top(p):
+    _add_common_query_args(p, _F24)
+    p.add_argument("--field", default="log_type", help="Field to aggregate (default: log_type)")
+    p.add_argument("--limit", type=int, default=10, help="Top N (default: 10)")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.rum", func_name="cmd_rum_top")
+
+
+RUM_SUBCOMMAND_BUILDERS = {
+    name: (help_, functools.partial(_build_rum_leaf, default_hours=hours,
+                                    func_name=func_name, query_help=query_help))
+    for name, (help_, hours, func_name, query_help) in RUM_LEAF_CMDS.items()
+}
+RUM_SUBCOMMAND_BUILDERS.update({
+    "fetch-all": ("Stream all RUM events (NDJSON)", _build_rum_fetch_all),
+    "top": ("Aggregate RUM events by field", _build_rum_top),
+})
+
+
+def _build_rum(p):
+    _describe(p, "rum")
+    rum_subs = p.add_subparsers(dest="rum_command", required=True)
+    for name, (help_, builder) in RUM_SUBCOMMAND_BUILDERS.items():
+        rum_subs.add_lazy_parser(name, builder, help=help_)
+
+
+# =========================================================================
+# Watchdog Subcommand
+# =========================================================================
+
+def _build_watchdog(p):
+    _describe(p, "watchdog")
+    _add_common_query_args(p, _F24)
+    p.add_argument("--source", choices=_SOURCE_CHOICES, default="logs",
+                   help=_HELP_SOURCE)
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.watchdog", func_name="cmd_watchdog")
+
+
+# =========================================================================
+# Views Subcommand Group
+# =========================================================================
+
+def _build_views_list(p):
+    p.add_argument("--search", help="Search term for view names")
+    p.add_argument("--source", choices=_SOURCE_CHOICES, default="logs",
+                   help=_HELP_SOURCE)
+    p.add_argument("--limit", type=int, default=10, help="Max views (default: 10)")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.watchdog", func_name="cmd_views_list")
+
+
+def _build_views(p):
+    _describe(p, "views")
+    views_subs = p.add_subparsers(dest="views_command", required=True)
+    views_subs.add_lazy_parser("list", _build_views_list, help="List saved views")
+
+
+# =========================================================================
+# Topology Subcommand
+# =========================================================================
+
+def _build_topology(p):
+    _describe(p, "topology")
+    p.add_argument("--env", default="sandbox", help="Environment (default: sandbox)")
+    p.add_argument("--hours", type=float, default=_F1, help="Hours back (default: 1)")
+    p.add_argument("--service", help="Filter to specific service and neighbors")
+    p.add_argument("--pretty", action="store_true", help=_HELP_PRETTY)
+    p.set_defaults(func_module="dd_cli.commands.topology", func_name="cmd_topology")
+
+
+# Top-level subcommands: name -> (help, builder). Builders add the
+# subcommand's arguments and only run when that subcommand is parsed.
+SUBCOMMAND_BUILDERS = {
+    "auth": ("Interactive auth setup", _build_auth),
+    "status": ("Check auth status", _build_status),
+    "list": ("List logs matching query", _build_list),
+    "fetch-one": ("Fetch single log details", _build_fetch_one),
+    "fetch-all": ("Stream all logs (NDJSON)", _build_fetch_all),
+    "deep": ("Fetch logs with full hydration", _build_deep),
+    "top": ("Top values for a field", _build_top),
+    "facet-info": ("Facet metadata/stats", _build_facet_info),
+    "trace": ("Find logs for a trace_id", _build_trace),
+    "rum": ("Query RUM (Real User Monitoring) data", _build_rum),
+    "watchdog": ("Search Watchdog AI insights", _build_watchdog),
+    "views": ("List saved Datadog views", _build_views),
+    "topology": ("Get service dependency graph", _build_topology),
+}
+
+
+def create_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Build the CLI parser.
+    
+    With `only`, register just that top-level subcommand. Use it when argv
+    already names a valid subcommand; top-level help and "invalid choice"
+    errors need the full parser.
+    """
+    parser = LazyArgumentParser(
         prog="dd-cli",
         description="Datadog CLI V2 - Query logs using internal web UI APIs",
     )
     subparsers = parser.add_subparsers(dest="command", required=True)
+    for name, (help_, builder) in SUBCOMMAND_BUILDERS.items():
+        if only is None or name == only:
+            subparsers.add_lazy_parser(name, builder, help=help_)
     
-    # --- auth ---
-    p_auth = subparsers.add_parser("auth", help="Interactive auth setup")
-    p_auth.set_defaults(func=cmd_auth)
-    
-    # --- status ---
-    p_status = subparsers.add_parser("status", help="Check auth status")
-    p_status.set_defaults(func=cmd_status)
-    
-    # --- list ---
-    p_list = subparsers.add_parser("list", help="List logs matching query")
-    p_list.add_argument("query", help="Search query")
-    p_list.add_argument("--hours", type=float, default=1, help="Hours back (default: 1)")
-    p_list.add_argument("--limit", type=int, default=100, help="Max logs (default: 100)")
-    p_list.add_argument("--profile", default="list", choices=list_profiles(),
-                        help="Column profile")
-    p_list.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_list.set_defaults(func=cmd_list)
-    
-    # --- fetch-one ---
-    p_fetch_one = subparsers.add_parser("fetch-one", help="Fetch single log details")
-    p_fetch_one.add_argument("log_id", help="Log ID")
-    p_fetch_one.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_fetch_one.set_defaults(func=cmd_fetch_one)
-    
-    # --- fetch-all ---
-    p_fetch_all = subparsers.add_parser("fetch-all", help="Stream all logs (NDJSON)")
-    p_fetch_all.add_argument("query", help="Search query")
-    p_fetch_all.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_fetch_all.add_argument("--max", type=int, default=1000, help="Max logs (default: 1000)")
-    p_fetch_all.add_argument("--profile", default="list", choices=list_profiles(),
-                             help="Column profile")
-    p_fetch_all.set_defaults(func=cmd_fetch_all)
-    
-    # --- deep ---
-    p_deep = subparsers.add_parser("deep", help="Fetch logs with full hydration")
-    p_deep.add_argument("query", help="Search query")
-    p_deep.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_deep.add_argument("--max", type=int, default=50, help="Max logs (default: 50)")
-    p_deep.add_argument("--concurrency", type=int, default=4, help="Parallel workers (default: 4)")
-    p_deep.add_argument("--profile", default="list", choices=list_profiles(),
-                        help="Column profile")
-    p_deep.set_defaults(func=cmd_deep)
-    
-    # --- top ---
-    p_top = subparsers.add_parser("top", help="Top values for a field")
-    p_top.add_argument("query", help="Search query")
-    p_top.add_argument("--field", default="service", help="Field to aggregate (default: service)")
-    p_top.add_argument("--hours", type=float, default=1, help="Hours back (default: 1)")
-    p_top.add_argument("--limit", type=int, default=10, help="Top N (default: 10)")
-    p_top.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_top.set_defaults(func=cmd_top)
-    
-    # --- facet-info ---
-    p_facet = subparsers.add_parser("facet-info", help="Facet metadata/stats")
-    p_facet.add_argument("query", help="Search query")
-    p_facet.add_argument("--facet", default="service", help="Facet path (default: service)")
-    p_facet.add_argument("--hours", type=float, default=1, help="Hours back (default: 1)")
-    p_facet.add_argument("--limit", type=int, default=50, help="Max values (default: 50)")
-    p_facet.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_facet.set_defaults(func=cmd_facet_info)
-    
-    # --- trace ---
-    p_trace = subparsers.add_parser("trace", help="Find logs for a trace_id")
-    p_trace.add_argument("trace_id", help="Trace ID")
-    p_trace.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_trace.add_argument("--limit", type=int, default=200, help="Max logs (default: 200)")
-    p_trace.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_trace.set_defaults(func=cmd_trace)
-    
-    # =========================================================================
-    # RUM Subcommand Group
-    # =========================================================================
-    p_rum = subparsers.add_parser(
-        "rum", 
-        help="Query RUM (Real User Monitoring) data",
-        description="""Query Datadog Real User Monitoring (RUM) data.
+    return parser
 
-RUM captures frontend user interactions: sessions, page views, clicks, 
-network requests, and JavaScript errors.
 
-Examples:
-  dd-cli rum sessions 'C-13947' --hours 48
-  dd-cli rum actions '"retrieve rates"' --hours 24
-  dd-cli rum errors '@usr.id:alice@example.com' --limit 50
-
-See also: dd-cli list (backend logs), dd-cli fields (explore schema)""",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    rum_subs = p_rum.add_subparsers(dest="rum_command", required=True)
-    
-    # rum sessions
-    p_rum_sessions = rum_subs.add_parser("sessions", help="Query user sessions")
-    p_rum_sessions.add_argument("query", help="Search query (e.g., customer ID, user email)")
-    p_rum_sessions.add_argument("--hours", type=float, default=48, help="Hours back (default: 48)")
-    p_rum_sessions.add_argument("--limit", type=int, default=100, help="Max results (default: 100)")
-    p_rum_sessions.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_rum_sessions.set_defaults(func=cmd_rum_sessions)
-    
-    # rum actions
-    p_rum_actions = rum_subs.add_parser("actions", help="Query user actions (clicks, inputs)")
-    p_rum_actions.add_argument("query", help="Search query")
-    p_rum_actions.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_rum_actions.add_argument("--limit", type=int, default=100, help="Max results (default: 100)")
-    p_rum_actions.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_rum_actions.set_defaults(func=cmd_rum_actions)
-    
-    # rum views
-    p_rum_views = rum_subs.add_parser("views", help="Query page views")
-    p_rum_views.add_argument("query", help="Search query")
-    p_rum_views.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_rum_views.add_argument("--limit", type=int, default=100, help="Max results (default: 100)")
-    p_rum_views.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_rum_views.set_defaults(func=cmd_rum_views)
+@functools.lru_cache(maxsize=None)
+def get_parser(only: Optional[str] = None) -> argparse.ArgumentParser:
+    """Return a parser from create_parser(), reused for the life of the process.
     
-    # rum errors  
-    p_rum_errors = rum_subs.add_parser("errors", help="Query frontend JS errors")
-    p_rum_errors.add_argument("query", help="Search query")
-    p_rum_errors.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_rum_errors.add_argument("--limit", type=int, default=100, help="Max results (default: 100)")
-    p_rum_errors.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_rum_errors.set_defaults(func=cmd_rum_errors)
-    
-    # rum resources
-    p_rum_resources = rum_subs.add_parser("resources", help="Query network resources (XHR, fetch)")
-    p_rum_resources.add_argument("query", help="Search query")
-    p_rum_resources.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_rum_resources.add_argument("--limit", type=int, default=100, help="Max results (default: 100)")
-    p_rum_resources.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_rum_resources.set_defaults(func=cmd_rum_resources)
-    
-    # rum fetch-all
-    p_rum_fetch_all = rum_subs.add_parser("fetch-all", help="Stream all RUM events (NDJSON)")
-    p_rum_fetch_all.add_argument("query", help="Search query")
-    p_rum_fetch_all.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_rum_fetch_all.add_argument("--max", type=int, default=500, help="Max events (default: 500)")
-    p_rum_fetch_all.add_argument("--type", choices=["session", "view", "action", "resource", "error"],
-                                  help="Filter by event type")
-    p_rum_fetch_all.set_defaults(func=cmd_rum_fetch_all)
-    
-    # rum top
-    p_rum_top = rum_subs.add_parser("top", help="Aggregate RUM events by field")
-    p_rum_top.add_argument("query", help="Search query")
-    p_rum_top.add_argument("--field", default="log_type", help="Field to aggregate (default: log_type)")
-    p_rum_top.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_rum_top.add_argument("--limit", type=int, default=10, help="Top N (default: 10)")
-    p_rum_top.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_rum_top.set_defaults(func=cmd_rum_top)
-    
-    # =========================================================================
-    # Watchdog Subcommand
-    # =========================================================================
-    p_watchdog = subparsers.add_parser(
-        "watchdog",
-        help="Search Watchdog AI insights",
-        description="""Search Watchdog insights for anomaly detection.
+    Parsing does not modify the parser, so repeated main() calls (daemon
+    mode, in-process test harnesses) share one per `only` value.
+    """
+    return create_parser(only)
 
-Watchdog uses AI to detect anomalies in your logs and RUM data.
 
-Examples:
-  dd-cli watchdog 'status:error' --hours 24
-  dd-cli watchdog 'service:pricing' --source logs""",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    p_watchdog.add_argument("query", help="Search query")
-    p_watchdog.add_argument("--hours", type=float, default=24, help="Hours back (default: 24)")
-    p_watchdog.add_argument("--source", choices=["logs", "rum"], default="logs",
-                            help="Data source (default: logs)")
-    p_watchdog.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_watchdog.set_defaults(func=cmd_watchdog)
-    
-    # =========================================================================
-    # Views Subcommand Group
-    # =========================================================================
-    p_views = subparsers.add_parser(
-        "views",
-        help="List saved Datadog views",
-        description="""List saved views in Datadog.
+# Subcommands that take no arguments: a bare `dd-cli status` is dispatched
+# straight from argv without building the parser.
+_NO_ARG_COMMANDS = {
+    "auth": ("dd_cli.commands.auth", "cmd_auth"),
+    "status": ("dd_cli.commands.auth", "cmd_status"),
+}
 
-Saved views are pre-configured search queries shared by your team.
 
-Examples:
-  dd-cli views list --source logs
-  dd-cli views list --search 'pricing' --source rum""",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    views_subs = p_views.add_subparsers(dest="views_command", required=True)
+def parse_args(argv=None) -> argparse.Namespace:
+    """Parse command-line arguments, skipping argparse for bare no-arg commands."""
+    if argv is None:
+        argv = sys.argv[1:]
     
-    # views list
-    p_views_list = views_subs.add_parser("list", help="List saved views")
-    p_views_list.add_argument("--search", help="Search term for view names")
-    p_views_list.add_argument("--source", choices=["logs", "rum"], default="logs",
-                               help="Data source (default: logs)")
-    p_views_list.add_argument("--limit", type=int, default=10, help="Max views (default: 10)")
-    p_views_list.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_views_list.set_defaults(func=cmd_views_list)
+    if len(argv) == 1 and argv[0] in _NO_ARG_COMMANDS:
+        func_module, func_name = _NO_ARG_COMMANDS[argv[0]]
+        return argparse.Namespace(command=argv[0], func_module=func_module, func_name=func_name)
     
-    # =========================================================================
-    # Topology Subcommand
-    # =========================================================================
-    p_topology = subparsers.add_parser(
-        "topology",
-        help="Get service dependency graph",
-        description="""Get service topology/dependency graph from APM.
+    only = argv[0] if argv and argv[0] in SUBCOMMAND_BUILDERS else None
+    return get_parser(only).parse_args(argv)
 
-Shows nodes (services) with health status and edges (dependencies).
 
-Examples:
-  dd-cli topology --env sandbox --hours 1 --pretty
-  dd-cli topology --env sandbox --service pricing --pretty""",
-        formatter_class=argparse.RawDescriptionHelpFormatter,
-    )
-    p_topology.add_argument("--env", default="sandbox", help="Environment (default: sandbox)")
-    p_topology.add_argument("--hours", type=float, default=1, help="Hours back (default: 1)")
-    p_topology.add_argument("--service", help="Filter to specific service and neighbors")
-    p_topology.add_argument("--pretty", action="store_true", help="Pretty print JSON")
-    p_topology.set_defaults(func=cmd_topology)
-    
-    return parser
+# Exit statuses. argparse exits with 2 on usage errors.
+EXIT_ERROR = 1
+EXIT_AUTH = 3
+EXIT_NETWORK = 4
+EXIT_INTERRUPTED = 130
+
 
+def _exit_code(exc: Exception) -> int:
+    """Map an exception raised by a command handler to an exit status."""
+    # requests is only in sys.modules if a handler imported it, in which
+    # case any of its exceptions may have been raised.
+    requests = sys.modules.get("requests")
+    if requests is not None and isinstance(exc, requests.RequestException):
+        response = exc.response
+        if response is not None and response.status_code in (401, 403):
+            return EXIT_AUTH
+        return EXIT_NETWORK
+    return EXIT_ERROR
 
-def main():
-    parser = create_parser()
-    args = parser.parse_args()
+
+def main(argv=None):
+    if argv is None:
+        argv = sys.argv[1:]
+    
+    if argv == ["--daemon"]:
+        from .daemon import serve
+        serve()
+        return
+    
+    args = parse_args(argv)
     
     try:
-        args.func(args)
+        # Handlers are referenced by name so only the module for the
+        # selected command (and what it imports) is loaded.
+        handler = getattr(importlib.import_module(args.func_module), args.func_name)
+        handler(args)
     except KeyboardInterrupt:
         print("\nInterrupted", file=sys.stderr)
-        sys.exit(130)
+        sys.exit(EXIT_INTERRUPTED)
+    except BrokenPipeError:
+        # Reader went away (e.g. `dd-cli fetch-all ... | head`). Point stdout
+        # at devnull so the flush at interpreter exit doesn't fail again.
+        devnull = os.open(os.devnull, os.O_WRONLY)
+        os.dup2(devnull, sys.stdout.fileno())
+        os.close(devnull)
+        sys.exit(0)
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)
-        sys.exit(1)
+        sys.exit(_exit_code(e))
 
 
 if __name__ == "__main__":
@@ -3,19 +3,24 @@
 Supports both logs and RUM data sources via the DataSource enum.
 """
 
-import json
 import sys
+import threading
 import time
+from collections import OrderedDict
 from enum import Enum
-from typing import Any, Dict, Iterator, List, Optional
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from types import MappingProxyType
+from typing import Any, BinaryIO, Dict, Iterator, List, Optional, Tuple
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, as_completed, wait
+from urllib.parse import quote, urlencode
 
 import requests
 from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
+from . import jsonlib
 from .auth import Auth
-from .profiles import get_profile
+from .cache import PageCache
+from .profiles import Column, get_profile
 
 
 class DataSource(Enum):
@@ -34,29 +39,138 @@ class RumEventType(Enum):
     LONG_TASK = "long_task"
 
 
+# Search prefix restricting a RUM query to one event type
+_RUM_TYPE_PREFIX = {e: f"@type:{e.value} " for e in RumEventType}
+
+
+# Fields shared by every logs-analytics list request; callers add columns,
+# limit, time, search and an optional startAt cursor. Read-only, since every
+# request body shares them: builders copy the top level with dict(...).
+_LIST_BASE = MappingProxyType({
+    "sort": MappingProxyType({"time": MappingProxyType({"order": "desc"})}),
+    "indexes": ("*",),
+    "includeEvents": True,
+    "computeCount": False,
+    "executionInfo": MappingProxyType({}),
+})
+
+
+def _rum_col(path: str) -> Column:
+    """Read-only RUM column spec for a field path."""
+    return MappingProxyType({"field": MappingProxyType({"path": path})})
+
+
+# RUM-specific columns
+_RUM_COLUMNS = (
+    _rum_col("timestamp"),
+    _rum_col("@type"),
+    _rum_col("@session.id"),
+    _rum_col("@usr.id"),
+    _rum_col("@view.name"),
+    _rum_col("@action.name"),
+    _rum_col("@error.message"),
+)
+
+# Topology query parameters other than env and the time window
+_ENTITIES_PARAMS_STATIC = {
+    "filter[columns]": "SERVICE_NAME,REQUESTS,REQUESTS_PER_SECOND,ERRORS,ERRORS_PERCENTAGE,LATENCY_AVG,LATENCY_P95",
+    "filter[entity.type.catalog.kind]": "service",
+    "order_by_col": "REQUESTS",
+    "order_by_desc": "true",
+    "source": "web-ui",
+    "page[size]": "1000",  # Get all services
+    "page[number]": "0",
+    "include": "entity.service_health",
+}
+_GRAPH_PARAMS_STATIC = {
+    "filter[columns]": "OPERATION_NAME,REQUESTS_PER_SECOND,LATENCY_AVG,ERRORS_PERCENTAGE",
+    "source": "web-ui",
+    "datastore": "metrics",
+    "page[size]": "0",
+    "return_legacy_fields": "false",
+    "include": "entity.service_health",
+    "filter[metadata]": "color",
+    "graph.hide_service_overrides": "false",
+}
+
+
+def _topology_node(attrs: Dict[str, Any]) -> Dict[str, Any]:
+    """Build a topology node from an apm-entity's attributes."""
+    stats = attrs.get("stats", {})
+    return {
+        "service": attrs.get("id_tags", {}).get("service", "unknown"),
+        "health": attrs.get("service_health", {}).get("status", "unknown"),
+        "stats": {
+            "requests_per_second": stats.get("requests_per_second"),
+            "latency_avg": stats.get("latency_avg"),
+            "latency_p95": stats.get("latency_p95"),
+            "errors_percentage": stats.get("errors_percentage"),
+        },
+    }
+
+
+def _topology_edge(item: Dict[str, Any]) -> Tuple[Optional[str], Optional[str], Dict[str, Any]]:
+    """(source_id, target_id, attributes) of an apm-entity-edge."""
+    rels = item.get("relationships", {})
+    return (
+        rels.get("source", {}).get("data", {}).get("id"),
+        rels.get("target", {}).get("data", {}).get("id"),
+        item.get("attributes", {}),
+    )
+
+
 class DatadogWebLogs:
     """Client for Datadog's internal web UI logs API."""
     
-    def __init__(self, auth: Auth, user_agent: str = "dd-cli-v2"):
+    # Keep-alive connections per host, fixed when the session is created.
+    # Concurrency beyond this waits for a free connection (pool_block).
+    DEFAULT_POOL_SIZE = 32
+    # fetch_one responses kept in memory (log entries don't change once indexed)
+    HYDRATION_CACHE_SIZE = 4096
+    
+    def __init__(self, auth: Auth, user_agent: str = "dd-cli-v2",
+                 timeout: float = 30.0, pool_size: int = DEFAULT_POOL_SIZE,
+                 cache_enabled: bool = False, hydration_cache: bool = True,
+                 transport: str = "requests"):
         self.auth = auth
+        self.timeout = timeout
+        self.pool_size = pool_size
+        # "requests" (HTTP/1.1, default) or "httpx" (HTTP/2, see dd_cli.http2)
+        self.transport = transport
         self.session = self._create_session(user_agent)
+        # Pages from fetch_all/rum_fetch_all, reused by re-runs within the TTL.
+        # Off unless asked for: it writes log content to disk (the CLI enables it)
+        self.page_cache = PageCache() if cache_enabled else None
+        # LRU of raw fetch_one responses by log id; deep_fetch calls it from worker threads
+        self._fetch_one_cache: Optional["OrderedDict[str, bytes]"] = (
+            OrderedDict() if hydration_cache else None
+        )
+        self._fetch_one_lock = threading.Lock()
     
     def _create_session(self, user_agent: str) -> requests.Session:
         """Create a session with retry logic."""
-        session = requests.Session()
+        if self.transport == "httpx":
+            from .http2 import Http2Session
+            
+            return Http2Session(
+                headers={
+                    "accept": "application/json",
+                    "content-type": "application/json",
+                    "user-agent": user_agent,
+                    "x-csrf-token": self.auth.csrf_token,
+                },
+                cookies={"dogweb": self.auth.dogweb_cookie},
+                max_connections=self.pool_size,
+            )
+        if self.transport != "requests":
+            raise ValueError(f"Unknown transport: {self.transport}")
         
-        # Retry strategy for transient errors
-        retry_strategy = Retry(
-            total=3,
-            backoff_factor=0.5,
-            status_forcelist=[429, 500, 502, 503, 504],
-            allowed_methods=["POST", "GET"],
-        )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
-        session.mount("https://", adapter)
-        session.mount("http://", adapter)
+        session = requests.Session()
+        self._mount_adapter(session, self.pool_size)
         
-        # Set headers
+        # Set headers. Accept-Encoding is left to requests: it advertises
+        # gzip/deflate, plus br when brotli is installed (the "fast" extra),
+        # so it never asks for an encoding urllib3 can't decode.
         session.headers.update({
             "accept": "application/json",
             "content-type": "application/json",
@@ -67,44 +181,97 @@ class DatadogWebLogs:
         
         return session
     
+    def _mount_adapter(self, session: requests.Session, pool_size: int):
+        """Mount a retrying, keep-alive adapter holding up to pool_size connections."""
+        # Retry strategy for transient errors. Throttling is handled here
+        # rather than by pacing every page: a 429/503 waits for Retry-After
+        # when Datadog sends it, otherwise for an exponential backoff.
+        # raise_on_status=False hands the final error response back so
+        # callers see an HTTPError rather than a RetryError.
+        retry_kwargs = dict(
+            total=3,
+            backoff_factor=0.5,
+            status_forcelist=[429, 500, 502, 503, 504],
+            allowed_methods=["POST", "GET"],
+            raise_on_status=False,
+        )
+        try:
+            # Jitter spreads out retries from concurrent deep_fetch workers
+            retry_strategy = Retry(**retry_kwargs, backoff_jitter=0.5)
+        except TypeError:
+            # urllib3 < 2.0 has no backoff_jitter
+            retry_strategy = Retry(**retry_kwargs)
+        # pool_block: threads wait for a free connection rather than opening
+        # one that is thrown away (with its TLS session) when returned
+        adapter = HTTPAdapter(
+            max_retries=retry_strategy,
+            pool_connections=4,
+            pool_maxsize=pool_size,
+            pool_block=True,
+        )
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+    
     def _post(self, path: str, payload: Dict[str, Any]) -> requests.Response:
         """POST request to Datadog API."""
         url = f"{self.auth.base_url}{path}"
-        response = self.session.post(url, data=json.dumps(payload))
+        response = self.session.post(url, data=jsonlib.dumps(payload), timeout=self.timeout)
         response.raise_for_status()
         return response
     
     def _get(self, path: str) -> requests.Response:
         """GET request to Datadog API."""
         url = f"{self.auth.base_url}{path}"
-        response = self.session.get(url)
+        response = self.session.get(url, timeout=self.timeout)
         response.raise_for_status()
         return response
     
     def _extract_cursor(self, resp_json: Dict[str, Any], 
                         response: requests.Response) -> Optional[str]:
         """Extract pagination cursor from response (multi-path)."""
-        # Try body paths first
-        result = resp_json.get("result", {}) or {}
-        
         # Path 1: .result.nextLogId
-        cursor = result.get("nextLogId")
+        cursor = (resp_json.get("result") or {}).get("nextLogId")
         if cursor:
             return cursor
         
         # Path 2: .meta.page.after
-        meta = resp_json.get("meta", {}) or {}
-        page = meta.get("page", {}) or {}
-        after = page.get("after")
+        after = ((resp_json.get("meta") or {}).get("page") or {}).get("after")
         if after:
             return after
         
-        # Path 3: Response headers
-        for header in ["x-datadog-next-log-id", "X-Datadog-Next-Log-Id"]:
-            if header in response.headers:
-                return response.headers[header]
+        # Path 3: Response header (requests' headers are case-insensitive)
+        return response.headers.get("x-datadog-next-log-id")
+    
+    def _list_page(self, path: str, body: Dict[str, Any],
+                   use_cache: bool = True) -> Tuple[Dict[str, Any], Optional[str]]:
+        """POST one list page, returning (data, next cursor).
         
-        return None
+        Pages are cached briefly, keyed on the request with its time window
+        rounded to the minute so an identical re-run hits.
+        """
+        cache = self.page_cache if use_cache else None
+        if cache is not None:
+            window = body["list"]["time"]
+            key = cache.key({
+                "base_url": self.auth.base_url,
+                "session": self.auth.dogweb_cookie,
+                "path": path,
+                "list": dict(body["list"], time={
+                    "from": window["from"] // 60000,
+                    "to": window["to"] // 60000,
+                }),
+            })
+            hit = cache.get(key)
+            if hit is not None:
+                return hit["data"], hit["cursor"]
+        
+        response = self._post(path, body)
+        data = jsonlib.loads(response.content)
+        cursor = self._extract_cursor(data, response)
+        
+        if cache is not None:
+            cache.set(key, {"data": data, "cursor": cursor})
+        return data, cursor
     
     def _time_range_ms(self, hours: float) -> tuple[int, int]:
         """Calculate time range in milliseconds."""
@@ -117,40 +284,41 @@ class DatadogWebLogs:
     # =========================================================================
     
     def list_logs(self, query: str, hours: float = 1, limit: int = 100,
-                  profile: str = "list", cursor: Optional[str] = None) -> Dict[str, Any]:
+                  profile: str = "list", cursor: Optional[str] = None,
+                  fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """
         List logs matching query.
         
         Endpoint: /api/v1/logs-analytics/list?type=logs
-        """
-        from_ms, to_ms = self._time_range_ms(hours)
-        columns = get_profile(profile)
         
-        body = {
-            "list": {
-                "columns": columns,
-                "sort": {"time": {"order": "desc"}},
-                "limit": limit,
-                "time": {"from": from_ms, "to": to_ms},
-                "search": {"query": query},
-                "indexes": ["*"],
-                "includeEvents": True,
-                "computeCount": False,
-                "executionInfo": {},
-            }
-        }
-        
-        if cursor:
-            body["list"]["startAt"] = cursor
+        Args:
+            fields: Explicit column paths to request instead of the profile's
+                columns, to keep responses small when only a few are needed
+        """
+        body = self._build_list_body(query, self._time_range_ms(hours), limit,
+                                     profile, cursor, fields)
         
-        return self._post("/api/v1/logs-analytics/list?type=logs", body).json()
+        return jsonlib.loads(self._post("/api/v1/logs-analytics/list?type=logs", body).content)
     
     def fetch_one(self, log_id: str) -> Dict[str, Any]:
         """
         Fetch full details of a single log entry.
         
         Endpoint: /api/v1/logs-analytics/fetch_one?type=logs
+        
+        Responses are kept in a per-client LRU (see HYDRATION_CACHE_SIZE), so
+        repeated ids don't go back to Datadog. The LRU holds the raw JSON
+        and every call decodes a fresh dict, so callers may modify it.
         """
+        cache = self._fetch_one_cache
+        if cache is not None:
+            with self._fetch_one_lock:
+                content = cache.get(log_id)
+                if content is not None:
+                    cache.move_to_end(log_id)
+            if content is not None:
+                return jsonlib.loads(content)
+        
         body = {
             "fetch_one": {
                 "id": log_id,
@@ -158,7 +326,14 @@ class DatadogWebLogs:
                 "executionInfo": {},
             }
         }
-        return self._post("/api/v1/logs-analytics/fetch_one?type=logs", body).json()
+        content = self._post("/api/v1/logs-analytics/fetch_one?type=logs", body).content
+        
+        if cache is not None:
+            with self._fetch_one_lock:
+                cache[log_id] = content
+                if len(cache) > self.HYDRATION_CACHE_SIZE:
+                    cache.popitem(last=False)
+        return jsonlib.loads(content)
     
     def aggregate(self, query: str, hours: float = 1, field: str = "service",
                   limit: int = 10) -> Dict[str, Any]:
@@ -198,7 +373,7 @@ class DatadogWebLogs:
                 "calculatedFields": [],
             }
         }
-        return self._post("/api/v1/logs-analytics/aggregate?type=logs", body).json()
+        return jsonlib.loads(self._post("/api/v1/logs-analytics/aggregate?type=logs", body).content)
     
     def facet_info(self, query: str, hours: float = 1, facet: str = "service",
                    limit: int = 50) -> Dict[str, Any]:
@@ -224,7 +399,7 @@ class DatadogWebLogs:
                 "extractions": [],
             }
         }
-        return self._post("/api/v1/logs-analytics/facet_info?type=logs", body).json()
+        return jsonlib.loads(self._post("/api/v1/logs-analytics/facet_info?type=logs", body).content)
     
     # =========================================================================
     # Streaming / Pagination Methods
@@ -232,63 +407,85 @@ class DatadogWebLogs:
     
     def fetch_all(self, query: str, hours: float = 24, 
                   page_size: int = 100, max_logs: int = 1000,
-                  profile: str = "list") -> Iterator[Dict[str, Any]]:
+                  profile: str = "list", use_cache: bool = True) -> Iterator[Dict[str, Any]]:
         """
         Stream all logs matching query with pagination (NDJSON).
         
-        Yields individual log events.
+        Yields individual log events. The last page only asks for the events
+        still needed to reach max_logs.
+        """
+        for events in self._log_pages(query, hours, page_size, max_logs, profile, use_cache):
+            yield from events
+    
+    def fetch_all_ndjson(self, out: BinaryIO, query: str, hours: float = 24,
+                         page_size: int = 100, max_logs: int = 1000,
+                         profile: str = "list", use_cache: bool = True) -> int:
         """
+        Write all logs matching query to a binary stream as NDJSON.
+        
+        Same results as fetch_all, but each page is serialized and written
+        in one go and the stream is flushed once per page. Returns the
+        number of events written.
+        """
+        dumps = jsonlib.dumps
+        count = 0
+        for events in self._log_pages(query, hours, page_size, max_logs, profile, use_cache):
+            out.write(b"".join([dumps(event) + b"\n" for event in events]))
+            out.flush()
+            count += len(events)
+        return count
+    
+    def _log_pages(self, query: str, hours: float, page_size: int, max_logs: int,
+                   profile: str, use_cache: bool) -> Iterator[List[Dict[str, Any]]]:
+        """Yield pages of log events, trimmed so the total stops at max_logs."""
+        # One window for the whole scan, so pages don't drift apart
+        time_range = self._time_range_ms(hours)
         cursor = None
         seen = 0
         
         while seen < max_logs:
             try:
-                response = self._post(
+                data, next_cursor = self._list_page(
                     "/api/v1/logs-analytics/list?type=logs",
-                    self._build_list_body(query, hours, page_size, profile, cursor)
+                    self._build_list_body(query, time_range, min(page_size, max_logs - seen),
+                                          profile, cursor),
+                    use_cache,
                 )
-                data = response.json()
             except requests.HTTPError as e:
                 print(f"HTTP Error: {e}", file=sys.stderr)
                 break
             
-            result = data.get("result", {}) or {}
-            events = result.get("events", []) or []
+            events = (data.get("result") or {}).get("events")
             
             if not events:
                 break
             
-            for event in events:
-                yield event
-                seen += 1
-                if seen >= max_logs:
-                    break
+            events = events[:max_logs - seen]
+            yield events
+            seen += len(events)
             
-            cursor = self._extract_cursor(data, response)
+            cursor = next_cursor
             if not cursor:
                 break
-            
-            # Light pacing to avoid rate limits
-            time.sleep(0.05)
     
-    def _build_list_body(self, query: str, hours: float, limit: int,
-                         profile: str, cursor: Optional[str]) -> Dict[str, Any]:
-        """Build list request body."""
-        from_ms, to_ms = self._time_range_ms(hours)
-        columns = get_profile(profile)
+    def _build_list_body(self, query: str, time_range: Tuple[int, int], limit: int,
+                         profile: str, cursor: Optional[str],
+                         fields: Optional[List[str]] = None) -> Dict[str, Any]:
+        """Build list request body for a (from_ms, to_ms) window."""
+        from_ms, to_ms = time_range
+        if fields:
+            columns = [{"field": {"path": path}} for path in fields]
+        else:
+            columns = get_profile(profile)
         
         body = {
-            "list": {
-                "columns": columns,
-                "sort": {"time": {"order": "desc"}},
-                "limit": limit,
-                "time": {"from": from_ms, "to": to_ms},
-                "search": {"query": query},
-                "indexes": ["*"],
-                "includeEvents": True,
-                "computeCount": False,
-                "executionInfo": {},
-            }
+            "list": dict(
+                _LIST_BASE,
+                columns=columns,
+                limit=limit,
+                time={"from": from_ms, "to": to_ms},
+                search={"query": query},
+            )
         }
         
         if cursor:
@@ -298,24 +495,16 @@ class DatadogWebLogs:
     
     def deep_fetch(self, query: str, hours: float = 24,
                    max_logs: int = 50, concurrency: int = 4,
-                   profile: str = "list") -> Iterator[Dict[str, Any]]:
+                   profile: str = "list", use_cache: bool = True) -> Iterator[Dict[str, Any]]:
         """
         Fetch logs with full hydration (list + fetch_one per log).
         
         Yields enriched log objects with both list and full event data.
+        List pages are streamed: each event is hydrated as soon as its page
+        arrives, overlapping hydration with the next page's request.
         """
-        # Step 1: Get list of logs
-        events = list(self.fetch_all(query, hours, 100, max_logs, profile))
-        
-        if not events:
-            return
-        
-        print(f"Hydrating {len(events)} logs with concurrency={concurrency}...", 
-              file=sys.stderr)
-        
-        # Step 2: Extract IDs and hydrate in parallel
         def hydrate(event: Dict[str, Any]) -> Dict[str, Any]:
-            log_id = event.get("event", {}).get("id") or event.get("id")
+            log_id = (event.get("event") or {}).get("id") or event.get("id")
             if not log_id:
                 return {"list_event": event, "full_event": None, "error": "no_id"}
             
@@ -325,24 +514,41 @@ class DatadogWebLogs:
             except Exception as e:
                 return {"list_event": event, "full_event": None, "error": str(e)}
         
-        with ThreadPoolExecutor(max_workers=concurrency) as executor:
-            futures = {executor.submit(hydrate, e): e for e in events}
-            
-            for future in as_completed(futures):
+        def results(futures) -> Iterator[Dict[str, Any]]:
+            for future in futures:
                 try:
-                    result = future.result()
-                    yield result
+                    yield future.result()
                 except Exception as e:
                     print(f"Hydration error: {e}", file=sys.stderr)
+        
+        # No point starting more workers than there are logs to hydrate
+        workers = max(1, min(concurrency, max_logs))
+        # Bound in-flight hydrations so listing can't run far ahead of output
+        max_pending = 2 * workers
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            pending = set()
+            submitted = 0
+            for event in self.fetch_all(query, hours, 100, max_logs, profile, use_cache):
+                if not submitted:
+                    print(f"Hydrating logs with concurrency={workers}...", file=sys.stderr)
+                pending.add(executor.submit(hydrate, event))
+                submitted += 1
+                if len(pending) >= max_pending:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    yield from results(done)
+            
+            yield from results(as_completed(pending))
     
     # =========================================================================
     # Convenience Methods
     # =========================================================================
     
-    def trace_logs(self, trace_id: str, hours: float = 24,
-                   limit: int = 200) -> Dict[str, Any]:
+    def trace_logs(self, trace_id: str, hours: float = 24, limit: int = 200,
+                   fields: Optional[List[str]] = None) -> Dict[str, Any]:
         """Find all logs for a specific trace_id."""
-        return self.list_logs(f"trace_id:{trace_id}", hours, limit, profile="trace")
+        return self.list_logs(f"trace_id:{trace_id}", hours, limit, profile="trace",
+                              fields=fields)
     
     def test_connection(self) -> bool:
         """Test if the authentication is valid."""
@@ -371,42 +577,10 @@ class DatadogWebLogs:
             event_type: Optional filter by RUM type (session, action, view, etc.)
             cursor: Pagination cursor from previous response
         """
-        from_ms, to_ms = self._time_range_ms(hours)
+        body = self._build_rum_list_body(query, self._time_range_ms(hours), limit,
+                                         event_type, cursor)
         
-        # Build query with optional type filter
-        full_query = query
-        if event_type:
-            full_query = f"@type:{event_type.value} {query}".strip()
-        
-        # RUM-specific columns
-        columns = [
-            {"field": {"path": "timestamp"}},
-            {"field": {"path": "@type"}},
-            {"field": {"path": "@session.id"}},
-            {"field": {"path": "@usr.id"}},
-            {"field": {"path": "@view.name"}},
-            {"field": {"path": "@action.name"}},
-            {"field": {"path": "@error.message"}},
-        ]
-        
-        body = {
-            "list": {
-                "columns": columns,
-                "sort": {"time": {"order": "desc"}},
-                "limit": limit,
-                "time": {"from": from_ms, "to": to_ms},
-                "search": {"query": full_query},
-                "indexes": ["*"],
-                "includeEvents": True,
-                "computeCount": False,
-                "executionInfo": {},
-            }
-        }
-        
-        if cursor:
-            body["list"]["startAt"] = cursor
-        
-        return self._post("/api/v1/logs-analytics/list?type=rum", body).json()
+        return jsonlib.loads(self._post("/api/v1/logs-analytics/list?type=rum", body).content)
     
     def rum_sessions(self, query: str, hours: float = 24, 
                      limit: int = 100) -> Dict[str, Any]:
@@ -471,28 +645,31 @@ class DatadogWebLogs:
                 "calculatedFields": [],
             }
         }
-        return self._post("/api/v1/logs-analytics/aggregate?type=rum", body).json()
+        return jsonlib.loads(self._post("/api/v1/logs-analytics/aggregate?type=rum", body).content)
     
     def rum_fetch_all(self, query: str, hours: float = 24, 
                       max_logs: int = 500, page_size: int = 100,
-                      event_type: Optional[RumEventType] = None) -> Iterator[Dict[str, Any]]:
+                      event_type: Optional[RumEventType] = None,
+                      use_cache: bool = True) -> Iterator[Dict[str, Any]]:
         """Stream all RUM events matching query with pagination."""
+        # One window for the whole scan, so pages don't drift apart
+        time_range = self._time_range_ms(hours)
         cursor = None
         seen = 0
         
         while seen < max_logs:
             try:
-                response = self._post(
+                data, next_cursor = self._list_page(
                     "/api/v1/logs-analytics/list?type=rum",
-                    self._build_rum_list_body(query, hours, page_size, event_type, cursor)
+                    self._build_rum_list_body(query, time_range, min(page_size, max_logs - seen),
+                                              event_type, cursor),
+                    use_cache,
                 )
-                data = response.json()
             except requests.HTTPError as e:
                 print(f"HTTP Error: {e}", file=sys.stderr)
                 break
             
-            result = data.get("result", {}) or {}
-            events = result.get("events", []) or []
+            events = (data.get("result") or {}).get("events") or ()
             
             if not events:
                 break
@@ -503,44 +680,26 @@ class DatadogWebLogs:
                 if seen >= max_logs:
                     break
             
-            cursor = self._extract_cursor(data, response)
+            cursor = next_cursor
             if not cursor:
                 break
-            
-            time.sleep(0.05)
     
-    def _build_rum_list_body(self, query: str, hours: float, limit: int,
+    def _build_rum_list_body(self, query: str, time_range: Tuple[int, int], limit: int,
                               event_type: Optional[RumEventType],
                               cursor: Optional[str]) -> Dict[str, Any]:
-        """Build RUM list request body."""
-        from_ms, to_ms = self._time_range_ms(hours)
+        """Build RUM list request body for a (from_ms, to_ms) window."""
+        from_ms, to_ms = time_range
         
-        full_query = query
-        if event_type:
-            full_query = f"@type:{event_type.value} {query}".strip()
-        
-        columns = [
-            {"field": {"path": "timestamp"}},
-            {"field": {"path": "@type"}},
-            {"field": {"path": "@session.id"}},
-            {"field": {"path": "@usr.id"}},
-            {"field": {"path": "@view.name"}},
-            {"field": {"path": "@action.name"}},
-            {"field": {"path": "@error.message"}},
-        ]
+        full_query = (_RUM_TYPE_PREFIX[event_type] + query).strip() if event_type else query
         
         body = {
-            "list": {
-                "columns": columns,
-                "sort": {"time": {"order": "desc"}},
-                "limit": limit,
-                "time": {"from": from_ms, "to": to_ms},
-                "search": {"query": full_query},
-                "indexes": ["*"],
-                "includeEvents": True,
-                "computeCount": False,
-                "executionInfo": {},
-            }
+            "list": dict(
+                _LIST_BASE,
+                columns=_RUM_COLUMNS,
+                limit=limit,
+                time={"from": from_ms, "to": to_ms},
+                search={"query": full_query},
+            )
         }
         
         if cursor:
@@ -566,7 +725,7 @@ class DatadogWebLogs:
             "type": source.value,
             "term": keyword,
         }
-        return self._post("/api/ui/event-platform/query/field", body).json()
+        return jsonlib.loads(self._post("/api/ui/event-platform/query/field", body).content)
     
     def field_values(self, field: str, query: str = "*", 
                      source: DataSource = DataSource.LOGS,
@@ -590,7 +749,7 @@ class DatadogWebLogs:
             "search": {"query": query},
             "time": {"from": from_ms, "to": to_ms},
         }
-        return self._post("/api/ui/event-platform/query/field-value", body).json()
+        return jsonlib.loads(self._post("/api/ui/event-platform/query/field-value", body).content)
     
     # =========================================================================
     # Service Map / Topology API Methods
@@ -620,98 +779,64 @@ class DatadogWebLogs:
                 "edges": [{"from": "api", "to": "pricing", "operation": "..."}, ...]
             }
         """
-        import urllib.parse
-        
         from_ms, to_ms = self._time_range_ms(hours)
         
         # Convert to Unix seconds (API expects seconds not milliseconds)
         from_sec = int(from_ms / 1000)
         to_sec = int(to_ms / 1000)
         
-        # Step 1: Get nodes (services) from /entities
+        # Nodes (services) come from /entities, edges from /entities/graph
         entities_params = {
             "filter[env]": env,
             "filter[from]": str(from_sec),
             "filter[to]": str(to_sec),
-            "filter[columns]": "SERVICE_NAME,REQUESTS,REQUESTS_PER_SECOND,ERRORS,ERRORS_PERCENTAGE,LATENCY_AVG,LATENCY_P95",
-            "filter[entity.type.catalog.kind]": "service",
-            "order_by_col": "REQUESTS",
-            "order_by_desc": "true",
-            "source": "web-ui",
-            "page[size]": "1000",  # Get all services
-            "page[number]": "0",
-            "include": "entity.service_health",
+            **_ENTITIES_PARAMS_STATIC,
         }
-        
-        entities_url = f"/api/unstable/apm/entities?{urllib.parse.urlencode(entities_params)}"
-        entities_resp = self._get(entities_url)
-        entities_data = entities_resp.json()
-        
-        # Step 2: Get edges from /entities/graph
         graph_params = {
             "filter[env]": env,
             "filter[from]": str(from_sec),
             "filter[to]": str(to_sec),
-            "filter[columns]": "OPERATION_NAME,REQUESTS_PER_SECOND,LATENCY_AVG,ERRORS_PERCENTAGE",
-            "source": "web-ui",
-            "datastore": "metrics",
-            "page[size]": "0",
-            "return_legacy_fields": "false",
-            "include": "entity.service_health",
-            "filter[metadata]": "color",
-            "graph.hide_service_overrides": "false",
+            **_GRAPH_PARAMS_STATIC,
         }
         
-        graph_url = f"/api/unstable/apm/entities/graph?{urllib.parse.urlencode(graph_params)}"
-        graph_resp = self._get(graph_url)
-        graph_data = graph_resp.json()
+        entities_url = f"/api/unstable/apm/entities?{urlencode(entities_params)}"
+        graph_url = f"/api/unstable/apm/entities/graph?{urlencode(graph_params)}"
+        
+        # The two reads are independent: fetch the graph on a worker thread
+        # (the session is safe to share across threads) while this thread
+        # fetches the entities.
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            graph_future = executor.submit(self._get, graph_url)
+            entities_data = jsonlib.loads(self._get(entities_url).content)
+            graph_data = jsonlib.loads(graph_future.result().content)
         
         # Parse nodes from entities response
-        nodes = []
-        node_id_to_service = {}
-        
-        for item in entities_data.get("data", []):
-            if item.get("type") == "apm-entity":
-                attrs = item.get("attributes", {})
-                id_tags = attrs.get("id_tags", {})
-                service_name = id_tags.get("service", "unknown")
-                node_id_to_service[item["id"]] = service_name
-                
-                # Extract health and stats
-                health_info = attrs.get("service_health", {})
-                stats_info = attrs.get("stats", {})
-                
-                nodes.append({
-                    "service": service_name,
-                    "health": health_info.get("status", "unknown"),
-                    "stats": {
-                        "requests_per_second": stats_info.get("requests_per_second"),
-                        "latency_avg": stats_info.get("latency_avg"),
-                        "latency_p95": stats_info.get("latency_p95"),
-                        "errors_percentage": stats_info.get("errors_percentage"),
-                    },
-                })
+        entities = [
+            (item["id"], item.get("attributes", {}))
+            for item in entities_data.get("data", ())
+            if item.get("type") == "apm-entity"
+        ]
+        nodes = [_topology_node(attrs) for _, attrs in entities]
+        node_id_to_service = {
+            node_id: node["service"] for (node_id, _), node in zip(entities, nodes)
+        }
         
         # Parse edges from graph response
-        edges = []
-        for item in graph_data.get("data", []):
-            if item.get("type") == "apm-entity-edge":
-                attrs = item.get("attributes", {})
-                rels = item.get("relationships", {})
-                
-                source_data = rels.get("source", {}).get("data", {})
-                target_data = rels.get("target", {}).get("data", {})
-                
-                source_id = source_data.get("id")
-                target_id = target_data.get("id")
-                
-                if source_id and target_id:
-                    edges.append({
-                        "from": node_id_to_service.get(source_id, source_id),
-                        "to": node_id_to_service.get(target_id, target_id),
-                        "operation": attrs.get("operation", ""),
-                        "span_kind": attrs.get("span.kind", ""),
-                    })
+        service_of = node_id_to_service.get
+        edges = [
+            {
+                "from": service_of(source_id, source_id),
+                "to": service_of(target_id, target_id),
+                "operation": attrs.get("operation", ""),
+                "span_kind": attrs.get("span.kind", ""),
+            }
+            for source_id, target_id, attrs in (
+                _topology_edge(item)
+                for item in graph_data.get("data", ())
+                if item.get("type") == "apm-entity-edge"
+            )
+            if source_id and target_id
+        ]
         
         # Optional: filter to specific service and its neighbors
         if service_filter:
@@ -754,7 +879,7 @@ class DatadogWebLogs:
             },
             "source": source.value,
         }
-        return self._post("/api/v2/watchdog/insights/search", body).json()
+        return jsonlib.loads(self._post("/api/v2/watchdog/insights/search", body).content)
     
     # =========================================================================
     # Saved Views API Methods
@@ -772,11 +897,10 @@ class DatadogWebLogs:
             source: Data source type
             limit: Max views to return
         """
-        import urllib.parse
-        encoded_search = urllib.parse.quote(search)
+        encoded_search = quote(search)
         url = f"/api/v1/logs/views?type={source.value}&q={encoded_search}&fullIntegration=false&limit={limit}&filter_by_me=false"
         
-        response = self.session.get(f"{self.auth.base_url}{url}")
+        response = self.session.get(f"{self.auth.base_url}{url}", timeout=self.timeout)
         response.raise_for_status()
-        return response.json()
+        return jsonlib.loads(response.content)
 
@@ -0,0 +1,6 @@
+"""Command handlers for dd-cli.
+
+Each module groups the ``cmd_*`` handlers for one area of the CLI. The
+parser only records a handler's module and name; ``dd_cli.cli.main``
+imports the module when that command actually runs.
+"""
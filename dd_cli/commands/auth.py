@@ -0,0 +1,48 @@
+"""Auth and status command handlers."""
+
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timezone
+
+from ..auth import load_auth, interactive_auth_setup, get_auth_file_path
+from .common import create_client
+
+
+def cmd_auth(args):
+    """Interactive auth setup."""
+    interactive_auth_setup()
+
+
+def cmd_status(args):
+    """Check auth status and test connection."""
+    auth = load_auth()
+
+    if not auth:
+        print("✗ No auth file found", file=sys.stderr)
+        print(f"  Run: dd-cli auth", file=sys.stderr)
+        sys.exit(1)
+
+    # Start the connection probe first so the network round-trip overlaps
+    # with the local token checks below. Same client setup (and transport)
+    # as the other commands.
+    client = create_client(auth)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        connection_ok = executor.submit(client.test_connection)
+
+        print(f"Auth file: {get_auth_file_path()}", file=sys.stderr)
+        print(f"Cookie length: {len(auth.dogweb_cookie)} chars", file=sys.stderr)
+        print(f"CSRF token: {auth.csrf_token[:20]}...", file=sys.stderr)
+
+        if auth.created_at:
+            age = datetime.now(timezone.utc) - auth.created_at
+            print(f"Token age: {age.days}d {age.seconds // 3600}h", file=sys.stderr)
+
+        print("\nTesting connection...", file=sys.stderr)
+        connected = connection_ok.result()
+
+    if connected:
+        print("✓ Connection successful", file=sys.stderr)
+    else:
+        print("✗ Connection failed - tokens may be expired", file=sys.stderr)
+        print("  Run: dd-cli auth", file=sys.stderr)
+        sys.exit(1)
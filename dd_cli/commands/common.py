@@ -0,0 +1,93 @@
+"""Helpers shared by the command handlers: client setup and JSON output."""
+
+import os
+import sys
+from typing import TYPE_CHECKING
+
+from .. import jsonlib
+from ..auth import load_auth_with_mtime, get_auth_file_path
+
+# dd_cli.client pulls in requests/urllib3, which dominates CLI start-up.
+# It is imported inside the handlers that talk to Datadog so that
+# --help, auth and argument errors never pay for it.
+if TYPE_CHECKING:
+    from ..client import DatadogWebLogs
+
+
+# Client reused across calls in the same process; invalidated when the
+# auth file changes on disk.
+_CLIENT_CACHE = {"mtime": None, "client": None, "auth": None}
+
+
+def create_client(auth) -> "DatadogWebLogs":
+    """Create a client using the transport selected by DD_CLI_TRANSPORT.
+
+    The page cache is enabled here, for CLI runs only; --no-cache turns it
+    off per command.
+    """
+    from ..client import DatadogWebLogs
+
+    return DatadogWebLogs(
+        auth,
+        cache_enabled=True,
+        transport=os.environ.get("DD_CLI_TRANSPORT", "requests"),
+    )
+
+
+def require_auth() -> "DatadogWebLogs":
+    """Load auth and create client, or exit with error."""
+    try:
+        mtime = get_auth_file_path().stat().st_mtime_ns
+    except OSError:
+        mtime = None
+
+    if mtime is not None and _CLIENT_CACHE["mtime"] == mtime:
+        return _CLIENT_CACHE["client"]
+
+    auth, mtime = load_auth_with_mtime()
+    if not auth:
+        print("No auth found. Run: dd-cli auth", file=sys.stderr)
+        sys.exit(1)
+
+    client = create_client(auth)
+    _CLIENT_CACHE.update(mtime=mtime, client=client, auth=auth)
+    return client
+
+
+def emit_json(obj, compact: bool = True):
+    """Emit JSON to stdout."""
+    data = jsonlib.dumps(obj) if compact else jsonlib.dumps_pretty(obj)
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        # stdout replaced by a text-only stream (e.g. captured in tests)
+        print(data.decode())
+        return
+    out.write(data + b"\n")
+
+
+# Streaming commands flush stdout every N records so downstream consumers
+# still see progress while writes are batched.
+_NDJSON_FLUSH_EVERY = 256
+
+
+def emit_ndjson(records) -> int:
+    """Stream records to stdout as NDJSON, returning the number written."""
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:
+        count = 0
+        for record in records:
+            emit_json(record)
+            count += 1
+        return count
+
+    write = out.write
+    dumps = jsonlib.dumps
+    count = 0
+    for record in records:
+        write(dumps(record))
+        write(b"\n")
+        count += 1
+        if count % _NDJSON_FLUSH_EVERY == 0:
+            out.flush()
+    out.flush()
+    return count
@@ -0,0 +1,97 @@
+"""Backend log command handlers."""
+
+import sys
+
+from .common import require_auth, emit_json, emit_ndjson
+
+
+def cmd_list(args):
+    """List logs matching query."""
+    client = require_auth()
+    result = client.list_logs(
+        query=args.query,
+        hours=args.hours,
+        limit=args.limit,
+        profile=args.profile,
+        fields=args.fields,
+    )
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_fetch_one(args):
+    """Fetch full details of a single log."""
+    client = require_auth()
+    result = client.fetch_one(args.log_id)
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_fetch_all(args):
+    """Stream all logs matching query (NDJSON)."""
+    client = require_auth()
+    kwargs = dict(
+        query=args.query,
+        hours=args.hours,
+        max_logs=args.max,
+        profile=args.profile,
+        use_cache=not args.no_cache,
+    )
+
+    out = getattr(sys.stdout, "buffer", None)
+    if out is not None:
+        count = client.fetch_all_ndjson(out, **kwargs)
+    else:
+        count = emit_ndjson(client.fetch_all(**kwargs))
+
+    print(f"Fetched {count} logs", file=sys.stderr)
+
+
+def cmd_deep(args):
+    """Fetch logs with full hydration (list + fetch_one)."""
+    client = require_auth()
+
+    count = emit_ndjson(client.deep_fetch(
+        query=args.query,
+        hours=args.hours,
+        max_logs=args.max,
+        concurrency=args.concurrency,
+        profile=args.profile,
+        use_cache=not args.no_cache,
+    ))
+
+    print(f"Deep-fetched {count} logs", file=sys.stderr)
+
+
+def cmd_top(args):
+    """Aggregate top values for a field."""
+    client = require_auth()
+    result = client.aggregate(
+        query=args.query,
+        hours=args.hours,
+        field=args.field,
+        limit=args.limit,
+    )
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_facet_info(args):
+    """Get facet metadata/stats."""
+    client = require_auth()
+    result = client.facet_info(
+        query=args.query,
+        hours=args.hours,
+        facet=args.facet,
+        limit=args.limit,
+    )
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_trace(args):
+    """Find all logs for a trace_id."""
+    client = require_auth()
+    result = client.trace_logs(
+        trace_id=args.trace_id,
+        hours=args.hours,
+        limit=args.limit,
+        fields=args.fields,
+    )
+    emit_json(result, compact=not args.pretty)
@@ -0,0 +1,62 @@
+"""RUM (Real User Monitoring) command handlers."""
+
+import sys
+
+from .common import require_auth, emit_json, emit_ndjson
+
+
+def cmd_rum_sessions(args):
+    """Query RUM sessions."""
+    client = require_auth()
+    result = client.rum_sessions(args.query, args.hours, args.limit)
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_rum_actions(args):
+    """Query RUM actions."""
+    client = require_auth()
+    result = client.rum_actions(args.query, args.hours, args.limit)
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_rum_views(args):
+    """Query RUM page views."""
+    client = require_auth()
+    result = client.rum_views(args.query, args.hours, args.limit)
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_rum_errors(args):
+    """Query RUM frontend errors."""
+    client = require_auth()
+    result = client.rum_errors(args.query, args.hours, args.limit)
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_rum_resources(args):
+    """Query RUM network resources."""
+    client = require_auth()
+    result = client.rum_resources(args.query, args.hours, args.limit)
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_rum_fetch_all(args):
+    """Stream all RUM events."""
+    from ..client import RumEventType
+
+    client = require_auth()
+    event_type = RumEventType(args.type) if args.type else None
+
+    count = emit_ndjson(
+        client.rum_fetch_all(args.query, args.hours, args.max, event_type=event_type,
+                             use_cache=not args.no_cache)
+    )
+
+    print(f"Fetched {count} RUM events", file=sys.stderr)
+
+
+def cmd_rum_top(args):
+    """Aggregate RUM events by field."""
+    client = require_auth()
+    result = client.rum_aggregate(args.query, args.hours, args.field, args.limit)
+    emit_json(result, compact=not args.pretty)
@@ -0,0 +1,14 @@
+"""Service topology command handlers."""
+
+from .common import require_auth, emit_json
+
+
+def cmd_topology(args):
+    """Get service topology/dependency graph."""
+    client = require_auth()
+    result = client.get_service_topology(
+        env=args.env,
+        hours=args.hours,
+        service_filter=args.service,
+    )
+    emit_json(result, compact=not args.pretty)
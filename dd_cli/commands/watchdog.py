@@ -0,0 +1,21 @@
+"""Watchdog and saved views command handlers."""
+
+from .common import require_auth, emit_json
+
+
+def cmd_watchdog(args):
+    """Search Watchdog insights."""
+    from ..client import DataSource
+
+    client = require_auth()
+    result = client.watchdog_insights(args.query, args.hours, DataSource(args.source))
+    emit_json(result, compact=not args.pretty)
+
+
+def cmd_views_list(args):
+    """List saved views."""
+    from ..client import DataSource
+
+    client = require_auth()
+    result = client.list_views(args.search or "", DataSource(args.source), args.limit)
+    emit_json(result, compact=not args.pretty)
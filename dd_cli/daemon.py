@@ -0,0 +1,201 @@
+"""Long-running ``dd-cli --daemon`` server.
+
+Keeps one warm interpreter (imports, parser, HTTP session and its
+keep-alive connections) and runs commands sent by ``dd-cli-client``.
+The client passes its stdin/stdout/stderr file descriptors along with
+argv, so each command reads and writes the caller's streams directly.
+
+Commands run one at a time: handlers write to the process-wide
+stdout/stderr, which are swapped per command.
+"""
+
+import json
+import os
+import signal
+import socket
+import stat
+import sys
+from contextlib import contextmanager
+from typing import Optional
+
+from .daemon_client import socket_path
+
+# Upper bound for the request message (a JSON-encoded argv).
+_MAX_REQUEST = 1 << 20
+# Seconds to wait for a client to finish sending its request. Requests are
+# handled one at a time, so a client that never sends would block the rest.
+_READ_TIMEOUT = 5.0
+# Exit status sent back for a malformed request (as for a usage error)
+_EXIT_BAD_REQUEST = 2
+
+
+class _Stop(BaseException):
+    """Raised from the SIGTERM handler; not caught by command error handling."""
+
+
+def _on_sigterm(signum, frame):
+    raise _Stop
+
+
+@contextmanager
+def _redirected(fds):
+    """Point fds 0-2 at the client's stdin/stdout/stderr for one command."""
+    sys.stdout.flush()
+    sys.stderr.flush()
+    saved = [os.dup(fd) for fd in (0, 1, 2)]
+    try:
+        for fd, target in zip(fds, (0, 1, 2)):
+            os.dup2(fd, target)
+        yield
+    finally:
+        for stream in (sys.stdout, sys.stderr):
+            try:
+                stream.flush()
+            except OSError:
+                pass
+        for fd, target in zip(saved, (0, 1, 2)):
+            os.dup2(fd, target)
+            os.close(fd)
+
+
+def _exit_status(code) -> int:
+    """Normalize a SystemExit code the way the interpreter does."""
+    if code is None:
+        return 0
+    if isinstance(code, int):
+        return code
+    print(code, file=sys.stderr)
+    return 1
+
+
+def _run(argv) -> int:
+    from .cli import main
+
+    try:
+        main(argv)
+    except SystemExit as e:
+        return _exit_status(e.code)
+    return 0
+
+
+def _read_request(conn, fds):
+    """Read the client's argv; descriptors sent with it are appended to fds."""
+    data, received, _flags, _addr = socket.recv_fds(conn, 4096, 3)
+    fds.extend(received)
+    chunks = [data]
+    size = len(data)
+    while data and size <= _MAX_REQUEST:
+        data = conn.recv(4096)
+        chunks.append(data)
+        size += len(data)
+    if size > _MAX_REQUEST:
+        raise ValueError("request too large")
+
+    request = json.loads(b"".join(chunks))
+    argv = request.get("argv") if isinstance(request, dict) else None
+    if not isinstance(argv, list) or not all(isinstance(arg, str) for arg in argv):
+        raise ValueError("argv must be a list of strings")
+    if argv[:1] == ["--daemon"]:
+        raise ValueError("--daemon cannot be run through the daemon")
+    if len(fds) != 3:
+        raise ValueError("expected stdin/stdout/stderr descriptors")
+    return argv
+
+
+def _reply(conn, code: int, error: Optional[str] = None):
+    reply = {"exit": code}
+    if error:
+        reply["error"] = error
+    try:
+        conn.sendall(json.dumps(reply).encode())
+    except OSError:
+        pass
+
+
+def _handle(conn):
+    fds = []
+    try:
+        conn.settimeout(_READ_TIMEOUT)
+        argv = _read_request(conn, fds)
+        conn.settimeout(None)
+        with _redirected(fds):
+            code = _run(argv)
+        _reply(conn, code)
+    except ValueError as e:
+        print(f"dd-cli daemon: bad request: {e}", file=sys.stderr)
+        _reply(conn, _EXIT_BAD_REQUEST, f"bad request: {e}")
+    except OSError as e:
+        # Client went away or timed out; there is no one left to answer
+        print(f"dd-cli daemon: connection error: {e}", file=sys.stderr)
+    except Exception as e:
+        # Never let one request take the daemon down
+        print(f"dd-cli daemon: error handling request: {e!r}", file=sys.stderr)
+        _reply(conn, 1, str(e))
+    finally:
+        for fd in fds:
+            os.close(fd)
+
+
+def _warm_up():
+    """Import everything a command may need so the first request is fast."""
+    from . import client  # noqa: F401
+    from .commands import auth, logs, rum, topology, watchdog  # noqa: F401
+
+
+def _remove_stale_socket(path: str):
+    """Remove a socket left behind by a daemon that is no longer running.
+
+    Refuses to touch anything else at path: a regular file, or a socket a
+    live daemon is still listening on.
+    """
+    try:
+        mode = os.lstat(path).st_mode
+    except FileNotFoundError:
+        return
+    if not stat.S_ISSOCK(mode):
+        print(f"Error: {path} exists and is not a socket; not replacing it",
+              file=sys.stderr)
+        sys.exit(1)
+    with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+        try:
+            probe.connect(path)
+        except ConnectionRefusedError:
+            pass
+        else:
+            print(f"Error: a dd-cli daemon is already listening on {path}",
+                  file=sys.stderr)
+            sys.exit(1)
+    os.unlink(path)
+
+
+def serve(path: Optional[str] = None):
+    """Listen on the daemon socket and run commands until interrupted."""
+    path = path or socket_path()
+    _warm_up()
+
+    _remove_stale_socket(path)
+
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    # Create the socket owner-only: it runs commands with our credentials
+    old_umask = os.umask(0o177)
+    try:
+        sock.bind(path)
+    finally:
+        os.umask(old_umask)
+    sock.listen()
+
+    signal.signal(signal.SIGTERM, _on_sigterm)
+    print(f"dd-cli daemon listening on {path}", file=sys.stderr)
+    try:
+        while True:
+            conn, _ = sock.accept()
+            with conn:
+                _handle(conn)
+    except (KeyboardInterrupt, _Stop):
+        print("\ndd-cli daemon stopped", file=sys.stderr)
+    finally:
+        sock.close()
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,96 @@
+"""Thin client for a running ``dd-cli --daemon``.
+
+Forwards argv plus this process's stdin/stdout/stderr to the daemon over
+its Unix socket, so output streams straight to the caller's terminal or
+pipe. Falls back to running the CLI in-process when no daemon is
+listening. Kept free of heavy imports: this is the start-up path.
+"""
+
+import json
+import os
+import socket
+import sys
+
+
+def socket_path() -> str:
+    """Path of the daemon's Unix socket (``DD_CLI_SOCKET`` or ``~/.dd-cli.sock``)."""
+    return os.environ.get("DD_CLI_SOCKET") or os.path.expanduser("~/.dd-cli.sock")
+
+
+# Same as cli.EXIT_INTERRUPTED (not imported: cli is the slow path)
+_EXIT_INTERRUPTED = 130
+
+
+def connect() -> socket.socket:
+    """Connect to the daemon's socket.
+
+    Raises FileNotFoundError or ConnectionRefusedError if no daemon is
+    listening.
+    """
+    sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    try:
+        sock.connect(socket_path())
+    except BaseException:
+        sock.close()
+        raise
+    return sock
+
+
+def run_remote(sock, argv) -> int:
+    """Run argv in the daemon connected on sock and return its exit status.
+
+    Once the request is sent the command may already be running, so
+    connection errors are reported rather than retried.
+    """
+    with sock:
+        try:
+            payload = json.dumps({"argv": list(argv)}).encode()
+            socket.send_fds(sock, [payload], [0, 1, 2])
+            sock.shutdown(socket.SHUT_WR)
+
+            chunks = []
+            while True:
+                chunk = sock.recv(4096)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except KeyboardInterrupt:
+            return _EXIT_INTERRUPTED
+        except OSError as e:
+            print(f"Error: dd-cli daemon connection failed: {e}", file=sys.stderr)
+            return 1
+
+    if not chunks:
+        # Daemon went away mid-command
+        print("Error: dd-cli daemon closed the connection", file=sys.stderr)
+        return 1
+    try:
+        reply = json.loads(b"".join(chunks))
+        code = reply["exit"]
+    except (ValueError, KeyError, TypeError):
+        code = None
+    if not isinstance(code, int):
+        print("Error: dd-cli daemon sent an invalid reply", file=sys.stderr)
+        return 1
+    if reply.get("error"):
+        print(f"Error: dd-cli daemon: {reply['error']}", file=sys.stderr)
+    return code
+
+
+def main():
+    argv = sys.argv[1:]
+    try:
+        sock = connect()
+    except (FileNotFoundError, ConnectionRefusedError):
+        # No daemon listening: run the command in-process
+        from .cli import main as cli_main
+        cli_main(argv)
+        return
+    except OSError as e:
+        print(f"Error: cannot connect to dd-cli daemon: {e}", file=sys.stderr)
+        sys.exit(1)
+    sys.exit(run_remote(sock, argv))
+
+
+if __name__ == "__main__":
+    main()
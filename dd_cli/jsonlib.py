@@ -0,0 +1,61 @@
+"""JSON encoding/decoding with optional orjson acceleration.
+
+orjson is used when installed (``pip install datadog-log-inspect[fast]``);
+otherwise everything falls back to the stdlib ``json`` module.
+"""
+
+import json
+from collections.abc import Mapping
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on environment
+    orjson = None
+
+
+def encode_default(obj: Any) -> Any:
+    """Encode read-only mappings (e.g. the column profiles) as objects."""
+    if isinstance(obj, Mapping):
+        return dict(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _stdlib_dumps(obj: Any, **kwargs) -> bytes:
+    """Encode with the json module, writing raw UTF-8 like orjson does."""
+    try:
+        return json.dumps(obj, ensure_ascii=False, default=encode_default, **kwargs).encode()
+    except UnicodeEncodeError:
+        # Lone surrogates can't be written as UTF-8; keep them as \u escapes
+        return json.dumps(obj, default=encode_default, **kwargs).encode()
+
+
+def dumps(obj: Any) -> bytes:
+    """Serialize to compact UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=encode_default)
+        except TypeError:
+            # e.g. integers wider than 64 bits - let the stdlib handle it
+            pass
+    return _stdlib_dumps(obj, separators=(",", ":"))
+
+
+def dumps_pretty(obj: Any) -> bytes:
+    """Serialize to indented UTF-8 JSON bytes."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, default=encode_default, option=orjson.OPT_INDENT_2)
+        except TypeError:
+            pass
+    return _stdlib_dumps(obj, indent=2)
+
+
+def loads(data: Any) -> Any:
+    """Deserialize JSON from bytes or str.
+    
+    Note: orjson decodes integers wider than 64 bits as floats.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
@@ -1,54 +1,92 @@
 """Column profiles for different log analysis use cases."""
 
-from typing import Dict, List
-
-
-# Pre-defined column sets for different analysis tasks
-PROFILES: Dict[str, List[Dict]] = {
-    "list": [
-        {"field": {"path": "timestamp"}},
-        {"field": {"path": "service"}},
-        {"field": {"path": "host"}},
-        {"field": {"path": "status"}},
-        {"field": {"path": "content"}},
-        {"field": {"path": "trace_id"}},
-    ],
-    "trace": [
-        {"field": {"path": "timestamp"}},
-        {"field": {"path": "service"}},
-        {"field": {"path": "span_id"}},
-        {"field": {"path": "trace_id"}},
-        {"field": {"path": "message"}},
-    ],
-    "k8s": [
-        {"field": {"path": "timestamp"}},
-        {"field": {"path": "kube_namespace"}},
-        {"field": {"path": "pod_name"}},
-        {"field": {"path": "container_id"}},
-        {"field": {"path": "message"}},
-    ],
-    "minimal": [
-        {"field": {"path": "timestamp"}},
-        {"field": {"path": "service"}},
-        {"field": {"path": "content"}},
-    ],
-    "full": [
-        {"field": {"path": "status_line"}},
-        {"field": {"path": "timestamp"}},
-        {"field": {"path": "host"}},
-        {"field": {"path": "service"}},
-        {"field": {"path": "content"}},
-        {"field": {"path": "trace_id"}},
-        {"field": {"path": "span_id"}},
-    ],
-}
-
-
-def get_profile(name: str) -> List[Dict]:
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping, Tuple
+
+# A column as the list API expects it: {"field": {"path": ...}}
+Column = Mapping[str, Mapping[str, str]]
+
+
+@lru_cache(maxsize=None)
+def _col(path: str) -> Column:
+    """Read-only column spec for a field path (one shared object per path)."""
+    return MappingProxyType({"field": MappingProxyType({"path": path})})
+
+
+__all__ = [
+    "PROFILES",
+    "get_profile",
+    "list_profiles",
+]
+
+# PROFILES is a module attribute built on first access
+# (PEP 562 __getattr__ below), so importing this module costs nothing
+# until a profile is actually used.
+
+
+@lru_cache(maxsize=None)
+def _profiles() -> Mapping[str, Tuple[Column, ...]]:
+    """Pre-defined column sets for different analysis tasks.
+
+    Profiles are shared by every request, so they are built once and
+    read-only, down to the table itself.
+    """
+    return MappingProxyType({
+        "list": (
+            _col("timestamp"),
+            _col("service"),
+            _col("host"),
+            _col("status"),
+            _col("content"),
+            _col("trace_id"),
+        ),
+        "trace": (
+            _col("timestamp"),
+            _col("service"),
+            _col("span_id"),
+            _col("trace_id"),
+            _col("message"),
+        ),
+        "k8s": (
+            _col("timestamp"),
+            _col("kube_namespace"),
+            _col("pod_name"),
+            _col("container_id"),
+            _col("message"),
+        ),
+        "minimal": (
+            _col("timestamp"),
+            _col("service"),
+            _col("content"),
+        ),
+        "full": (
+            _col("status_line"),
+            _col("timestamp"),
+            _col("host"),
+            _col("service"),
+            _col("content"),
+            _col("trace_id"),
+            _col("span_id"),
+        ),
+    })
+
+
+def __getattr__(name: str):
+    if name == "PROFILES":
+        return _profiles()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def get_profile(name: str) -> Tuple[Column, ...]:
     """Get column profile by name, defaults to 'list' profile."""
-    return PROFILES.get(name, PROFILES["list"])
+    profiles = _profiles()
+    profile = profiles.get(name)
+    # Only look up the default when the name is unknown
+    return profile if profile is not None else profiles["list"]
 
 
-def list_profiles() -> List[str]:
+@lru_cache(maxsize=None)
+def list_profiles() -> Tuple[str, ...]:
     """List available profile names."""
-    return list(PROFILES.keys())
+    return tuple(_profiles())
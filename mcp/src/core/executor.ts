@@ -2,18 +2,21 @@
  * dd-cli executor - wrapper for running dd-cli commands
  */
 
-import { exec } from "child_process";
+import { execFile } from "child_process";
 import { promisify } from "util";
 import { resolve, dirname } from "path";
 import { fileURLToPath } from "url";
 
-const execAsync = promisify(exec);
+// execFile spawns python3 directly (no intermediate /bin/sh), so concurrent
+// tool calls each cost one process and need no shell quoting.
+const execFileAsync = promisify(execFile);
 
 const __filename = fileURLToPath(import.meta.url);
 const __dirname = dirname(__filename);
 
-// Path to dd-cli in parent directory
-const DD_CLI_PATH = resolve(__dirname, "../../../dd-cli");
+// Run the dd_cli package as a module; works when it is pip-installed, and the
+// repo root on PYTHONPATH covers running from a plain source checkout.
+const DD_CLI_ARGS = ["-m", "dd_cli"];
 const PYTHONPATH = resolve(__dirname, "../../..");
 
 const TIMEOUT_MS = parseInt(process.env.DD_MCP_TIMEOUT_MS || "60000", 10);
@@ -24,7 +27,7 @@ const DEBUG = process.env.DD_MCP_DEBUG === "true";
  */
 export async function checkDdCli(): Promise<{ available: boolean; error?: string }> {
     try {
-        const { stdout } = await execAsync(`python3 ${DD_CLI_PATH} status`, {
+        await execFileAsync("python3", [...DD_CLI_ARGS, "status"], {
             timeout: 10000,
             env: { ...process.env, PYTHONPATH },
         });
@@ -42,23 +45,12 @@ export async function checkDdCli(): Promise<{ available: boolean; error?: string
  * Execute a dd-cli command and return raw stdout
  */
 export async function execDdCli(args: string[]): Promise<string> {
-    // Shell-quote each argument to handle spaces and special chars
-    const quotedArgs = args.map(arg => {
-        // If arg contains spaces, special chars, or glob chars (*?[]), quote it
-        if (/[\s"'$`\\*?[\]]/.test(arg)) {
-            // Escape single quotes and wrap in single quotes
-            return `'${arg.replace(/'/g, "'\\''")}'`;
-        }
-        return arg;
-    });
-    const command = `python3 ${DD_CLI_PATH} ${quotedArgs.join(" ")}`;
-
     if (DEBUG) {
-        console.error(`[datadog-mcp] Executing: ${command}`);
+        console.error(`[datadog-mcp] Executing: python3 -m dd_cli ${args.join(" ")}`);
     }
 
     try {
-        const { stdout, stderr } = await execAsync(command, {
+        const { stdout, stderr } = await execFileAsync("python3", [...DD_CLI_ARGS, ...args], {
             timeout: TIMEOUT_MS,
             maxBuffer: 10 * 1024 * 1024,
             env: { ...process.env, PYTHONPATH },
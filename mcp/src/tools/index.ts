@@ -3,7 +3,10 @@
  */
 
 import { Tool } from "@modelcontextprotocol/sdk/types.js";
-import { execDdCliJson } from "../core/executor.js";
+import { execDdCli, execDdCliJson } from "../core/executor.js";
+
+// Upper bound on dd-cli processes a single dd_batch call may spawn at once
+const MAX_BATCH_CALLS = 10;
 
 export const TOOLS: Tool[] = [
     {
@@ -24,6 +27,7 @@ export const TOOLS: Tool[] = [
                 query: { type: "string", description: "Datadog search query (same syntax as web UI)" },
                 hours: { type: "number", description: "Hours back to search (default: 24)", default: 24 },
                 limit: { type: "number", description: "Max results (default: 50)", default: 50 },
+                simplified: { type: "boolean", description: "Return trimmed events (default: true). Set false for the raw dd-cli response.", default: true },
             },
             required: ["query"],
         },
@@ -37,6 +41,7 @@ export const TOOLS: Tool[] = [
                 trace_id: { type: "string", description: "The trace ID to search for" },
                 hours: { type: "number", description: "Hours back to search (default: 24)", default: 24 },
                 limit: { type: "number", description: "Max logs (default: 200)", default: 200 },
+                simplified: { type: "boolean", description: "Return trimmed events (default: true). Set false for the raw dd-cli response.", default: true },
             },
             required: ["trace_id"],
         },
@@ -134,6 +139,31 @@ export const TOOLS: Tool[] = [
             required: ["query"],
         },
     },
+    // =============================================================================
+    // Batch Tool
+    // =============================================================================
+    {
+        name: "dd_batch",
+        description: "Run several dd_* tool calls concurrently in one request. Use for: correlating the same ID across logs and RUM (e.g. dd_trace_logs + dd_rum_errors) without waiting on each call in turn.",
+        inputSchema: {
+            type: "object",
+            properties: {
+                calls: {
+                    type: "array",
+                    description: `Tool calls to run (max ${MAX_BATCH_CALLS}), e.g. [{"tool": "dd_trace_logs", "args": {"trace_id": "abc123"}}]`,
+                    items: {
+                        type: "object",
+                        properties: {
+                            tool: { type: "string", description: "Name of another dd_* tool" },
+                            args: { type: "object", description: "Arguments for that tool" },
+                        },
+                        required: ["tool"],
+                    },
+                },
+            },
+            required: ["calls"],
+        },
+    },
 ];
 
 
@@ -155,12 +185,22 @@ interface LogResult {
     };
 }
 
+const MAX_MESSAGE_LENGTH = 2000;
+
+function truncateMessage(message: unknown): string {
+    if (typeof message !== "string") {
+        return "";
+    }
+    // Only copy when the message actually needs trimming
+    return message.length > MAX_MESSAGE_LENGTH ? message.substring(0, MAX_MESSAGE_LENGTH) : message;
+}
+
 function simplifyLogEvent(event: Record<string, unknown>, compoundId?: string): LogEvent {
     return {
         timestamp: event.timestamp as string,
         service: event.service as string,
         status: event.status as string,
-        message: ((event.message as string) || "").substring(0, 2000),
+        message: truncateMessage(event.message),
         trace_id: event.trace_id as string,
         id: event.id as string,
         source_fragment_id: event.source_fragment_id as string,
@@ -180,6 +220,26 @@ function simplifyLogs(result: LogResult): { count: number; events: LogEvent[] }
     return { count: simplified.length, events: simplified };
 }
 
+/**
+ * Run a dd-cli search subcommand with the shared query/--hours/--limit
+ * arguments, falling back to the tool's defaults.
+ */
+function runSearch(
+    command: string[],
+    query: string,
+    args: Record<string, unknown>,
+    defaults: { hours: number; limit: number }
+): Promise<LogResult> {
+    const hours = (args.hours as number) || defaults.hours;
+    const limit = (args.limit as number) || defaults.limit;
+    return execDdCliJson<LogResult>([
+        ...command,
+        query,
+        "--hours", String(hours),
+        "--limit", String(limit),
+    ]);
+}
+
 export async function handleToolCall(
     name: string,
     args: Record<string, unknown>
@@ -187,7 +247,6 @@ export async function handleToolCall(
     switch (name) {
         case "dd_auth_status": {
             // status command outputs to stderr, not JSON - handle specially
-            const { execDdCli } = await import("../core/executor.js");
             try {
                 await execDdCli(["status"]);
                 return { status: "authenticated", message: "dd-cli auth tokens are valid" };
@@ -205,29 +264,13 @@ export async function handleToolCall(
         }
 
         case "dd_search_logs": {
-            const query = args.query as string;
-            const hours = (args.hours as number) || 24;
-            const limit = (args.limit as number) || 50;
-            const result = await execDdCliJson<LogResult>([
-                "list",
-                query,
-                "--hours", String(hours),
-                "--limit", String(limit),
-            ]);
-            return simplifyLogs(result);
+            const result = await runSearch(["list"], args.query as string, args, { hours: 24, limit: 50 });
+            return args.simplified === false ? result : simplifyLogs(result);
         }
 
         case "dd_trace_logs": {
-            const traceId = args.trace_id as string;
-            const hours = (args.hours as number) || 24;
-            const limit = (args.limit as number) || 200;
-            const result = await execDdCliJson<LogResult>([
-                "trace",
-                traceId,
-                "--hours", String(hours),
-                "--limit", String(limit),
-            ]);
-            return simplifyLogs(result);
+            const result = await runSearch(["trace"], args.trace_id as string, args, { hours: 24, limit: 200 });
+            return args.simplified === false ? result : simplifyLogs(result);
         }
 
         case "dd_fetch_log": {
@@ -270,57 +313,48 @@ export async function handleToolCall(
         // =====================================================================
 
         case "dd_rum_sessions": {
-            const query = args.query as string;
-            const hours = (args.hours as number) || 48;
-            const limit = (args.limit as number) || 50;
-            const result = await execDdCliJson<LogResult>([
-                "rum", "sessions",
-                query,
-                "--hours", String(hours),
-                "--limit", String(limit),
-            ]);
+            const result = await runSearch(["rum", "sessions"], args.query as string, args, { hours: 48, limit: 50 });
             return simplifyLogs(result);
         }
 
         case "dd_rum_actions": {
-            const query = args.query as string;
-            const hours = (args.hours as number) || 24;
-            const limit = (args.limit as number) || 50;
-            const result = await execDdCliJson<LogResult>([
-                "rum", "actions",
-                query,
-                "--hours", String(hours),
-                "--limit", String(limit),
-            ]);
+            const result = await runSearch(["rum", "actions"], args.query as string, args, { hours: 24, limit: 50 });
             return simplifyLogs(result);
         }
 
         case "dd_rum_errors": {
-            const query = args.query as string;
-            const hours = (args.hours as number) || 24;
-            const limit = (args.limit as number) || 50;
-            const result = await execDdCliJson<LogResult>([
-                "rum", "errors",
-                query,
-                "--hours", String(hours),
-                "--limit", String(limit),
-            ]);
+            const result = await runSearch(["rum", "errors"], args.query as string, args, { hours: 24, limit: 50 });
             return simplifyLogs(result);
         }
 
         case "dd_rum_resources": {
-            const query = args.query as string;
-            const hours = (args.hours as number) || 24;
-            const limit = (args.limit as number) || 50;
-            const result = await execDdCliJson<LogResult>([
-                "rum", "resources",
-                query,
-                "--hours", String(hours),
-                "--limit", String(limit),
-            ]);
+            const result = await runSearch(["rum", "resources"], args.query as string, args, { hours: 24, limit: 50 });
             return simplifyLogs(result);
         }
 
+        // =====================================================================
+        // Batch Handler
+        // =====================================================================
+
+        case "dd_batch": {
+            const calls = (args.calls as Array<{ tool: string; args?: Record<string, unknown> }>) || [];
+            if (calls.length > MAX_BATCH_CALLS) {
+                throw new Error(`dd_batch accepts at most ${MAX_BATCH_CALLS} calls (got ${calls.length})`);
+            }
+            // Calls run side by side; a failing call is reported in its own
+            // slot instead of failing the whole batch.
+            return Promise.all(calls.map(async (call) => {
+                if (call.tool === "dd_batch") {
+                    return { tool: call.tool, error: "dd_batch cannot be nested" };
+                }
+                try {
+                    return { tool: call.tool, result: await handleToolCall(call.tool, call.args || {}) };
+                } catch (error) {
+                    return { tool: call.tool, error: error instanceof Error ? error.message : String(error) };
+                }
+            }));
+        }
+
         default:
             throw new Error(`Unknown tool: ${name}`);
     }
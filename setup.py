@@ -1,58 +0,0 @@
-"""Setup configuration for datadog-log-inspect."""
-
-from setuptools import setup, find_packages
-from pathlib import Path
-
-# Read README for long description
-readme_file = Path(__file__).parent / "README.md"
-long_description = readme_file.read_text(encoding="utf-8") if readme_file.exists() else ""
-
-# Read requirements
-requirements_file = Path(__file__).parent / "requirements.txt"
-requirements = []
-if requirements_file.exists():
-    requirements = [
-        line.strip()
-        for line in requirements_file.read_text(encoding="utf-8").splitlines()
-        if line.strip() and not line.startswith("#")
-    ]
-
-setup(
-    name="datadog-log-inspect",
-    version="2.0.0",
-    author="Datadog Log Inspect Contributors",
-    description="CLI and MCP server for querying Datadog logs and RUM using internal web UI APIs",
-    long_description=long_description,
-    long_description_content_type="text/markdown",
-    url="https://github.com/yourusername/datadog-log-inspect",  # Update with actual repo URL
-    packages=find_packages(exclude=["tests", "tests.*", "mcp", "mcp.*"]),
-    install_requires=requirements,
-    extras_require={
-        "dev": [
-            "pytest>=7.0.0",
-            "pytest-cov>=4.0.0",
-            "ruff>=0.1.0",
-            "black>=23.0.0",
-            "mypy>=1.0.0",
-        ],
-    },
-    entry_points={
-        "console_scripts": [
-            "dd-cli=dd_cli.cli:main",
-        ],
-    },
-    python_requires=">=3.9",
-    classifiers=[
-        "Development Status :: 4 - Beta",
-        "Intended Audience :: Developers",
-        "License :: OSI Approved :: MIT License",
-        "Programming Language :: Python :: 3",
-        "Programming Language :: Python :: 3.9",
-        "Programming Language :: Python :: 3.10",
-        "Programming Language :: Python :: 3.11",
-        "Programming Language :: Python :: 3.12",
-        "Topic :: Software Development :: Debuggers",
-        "Topic :: System :: Logging",
-    ],
-    keywords="datadog logs rum debugging mcp",
-)